@@ -1,63 +1,121 @@
 import os
+import threading
 import urllib.parse
+from importlib.util import find_spec
 import gi
 gi.require_version("Gtk", "4.0")
 gi.require_version("Gdk", "4.0")
-from gi.repository import Gtk, Gdk, GLib, Pango
+from gi.repository import Gtk, Gdk, Gio, GLib, Pango
 from .i18n import tr
 
-try:
-    import qrcode
-    from qrcode.exceptions import DataOverflowError
-    HAS_QR = True
-except ImportError:
-    qrcode = None
-    DataOverflowError = Exception
-    HAS_QR = False
-
-try:
-    import pytesseract
-    from PIL import Image, ImageOps, ImageEnhance
-    HAS_OCR = True
-except ImportError:
-    HAS_OCR = False
+# Optional dependencies (qrcode, Pillow, pytesseract) are imported on first
+# use; find_spec is enough to decide whether QR/OCR actions are offered.
+HAS_QR = find_spec("qrcode") is not None
+HAS_OCR = find_spec("pytesseract") is not None and find_spec("PIL") is not None
+
+qrcode = None
+DataOverflowError = Exception
+pytesseract = None
+Image = ImageOps = ImageEnhance = ImageStat = None
+
+# Tesseract's OpenMP threading is slower than a single thread for
+# screenshot-sized images; must be set before tesseract is spawned.
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+def _ensure_qr() -> bool:
+    """Import qrcode on first use. Returns HAS_QR."""
+    global qrcode, DataOverflowError, HAS_QR
+    if HAS_QR and qrcode is None:
+        try:
+            import qrcode
+            from qrcode.exceptions import DataOverflowError
+        except ImportError:
+            qrcode = None
+            HAS_QR = False
+    return HAS_QR
+
+_QR = None
+
+def _get_qr():
+    """Return the shared QRCode instance, reset for new data."""
+    global _QR
+    if _QR is None:
+        _QR = qrcode.QRCode(
+            version=None,
+            error_correction=qrcode.constants.ERROR_CORRECT_L,
+            box_size=8,
+            border=3,
+        )
+    else:
+        _QR.clear()
+        # make(fit=True) only searches upwards from the current version
+        _QR.version = None
+    return _QR
+
+def _ensure_ocr() -> bool:
+    """Import pytesseract and Pillow on first use. Returns HAS_OCR."""
+    global pytesseract, Image, ImageOps, ImageEnhance, ImageStat, HAS_OCR
+    if HAS_OCR and pytesseract is None:
+        try:
+            from PIL import Image, ImageOps, ImageEnhance, ImageStat
+            import pytesseract
+        except ImportError:
+            pytesseract = None
+            HAS_OCR = False
+    return HAS_OCR
+
+# config: --psm 6 (Assume a single uniform block of text) or 3 (Fully automatic)
+# 3 is default. 6 is good for code snippets. Let's try default first or slightly tuned.
+OCR_LANG = "rus+eng"
+OCR_CONFIG = r'--psm 3'
+# Longest side an image may reach when upscaled for OCR
+OCR_UPSCALE_MAX_SIDE = 3000
+
+def _preprocess_ocr_image(image_path: str):
+    """Load an image and prepare it for Tesseract."""
+    img = Image.open(image_path)
+    
+    # Preprocessing for better accuracy
+    # 1. Convert to grayscale
+    img = img.convert('L')
+    
+    # 2. Check if dark mode (inverse if necessary)
+    # Calculate average pixel brightness (histogram-based, no per-pixel list)
+    avg_brightness = ImageStat.Stat(img).mean[0]
+    if avg_brightness < 128:
+        # Dark background, light text -> Invert
+        img = ImageOps.invert(img)
+        
+    # 3. Increase contrast
+    enhancer = ImageEnhance.Contrast(img)
+    img = enhancer.enhance(2.0)
+    
+    # 4. Resize (upscale) if small, helps with small fonts
+    # Only tiny images pay for Lanczos; bilinear is close enough for OCR otherwise.
+    # Wide images (one-line screenshots) are left alone, as before.
+    if img.width < 1000:
+        if img.width < 400:
+            scale, resample = 3, Image.Resampling.LANCZOS
+        else:
+            scale, resample = 2, Image.Resampling.BILINEAR
+        scale = min(scale, OCR_UPSCALE_MAX_SIDE / max(img.width, img.height))
+        if scale > 1:
+            img = img.resize(
+                (max(1, round(img.width * scale)), max(1, round(img.height * scale))),
+                resample,
+            )
+
+    # 5. Denoise/Threshold (Optional, maybe too aggressive)
+    # img = img.point(lambda x: 0 if x < 140 else 255) 
+    return img
 
 def perform_ocr(image_path: str) -> str:
     """Extract text from image using Tesseract with preprocessing."""
-    if not HAS_OCR or not image_path:
+    if not image_path or not _ensure_ocr():
         return ""
     try:
-        img = Image.open(image_path)
-        
-        # Preprocessing for better accuracy
-        # 1. Convert to grayscale
-        img = img.convert('L')
-        
-        # 2. Check if dark mode (inverse if necessary)
-        # Calculate average pixel brightness
-        stat = list(img.getdata())
-        avg_brightness = sum(stat) / len(stat)
-        if avg_brightness < 128:
-            # Dark background, light text -> Invert
-            img = ImageOps.invert(img)
-            
-        # 3. Increase contrast
-        enhancer = ImageEnhance.Contrast(img)
-        img = enhancer.enhance(2.0)
-        
-        # 4. Resize (upscale) if small, helps with small fonts
-        if img.width < 1000:
-            scale = 2
-            img = img.resize((img.width * scale, img.height * scale), Image.Resampling.LANCZOS)
-
-        # 5. Denoise/Threshold (Optional, maybe too aggressive)
-        # img = img.point(lambda x: 0 if x < 140 else 255) 
-
-        # config: --psm 6 (Assume a single uniform block of text) or 3 (Fully automatic)
-        # 3 is default. 6 is good for code snippets. Let's try default first or slightly tuned.
-        custom_config = r'--psm 3'
-        
-        text = pytesseract.image_to_string(img, lang='rus+eng', config=custom_config)
+        img = _preprocess_ocr_image(image_path)
+        text = pytesseract.image_to_string(img, lang=OCR_LANG, config=OCR_CONFIG)
         return text.strip()
     except pytesseract.TesseractNotFoundError:
         return tr("actions.ocr_missing")
@@ -65,23 +123,36 @@ def perform_ocr(image_path: str) -> str:
         print(f"OCR Error: {e}")
         return tr("actions.ocr_error", error=e)
 
+def perform_ocr_async(image_path: str, callback):
+    """Run perform_ocr in a background thread, deliver text on the main loop."""
+    def _run():
+        text = perform_ocr(image_path)
+        GLib.idle_add(callback, text)
+
+    thread = threading.Thread(target=_run, daemon=True)
+    thread.start()
+
 def open_google_translate(text: str):
     """Open text in Google Translate."""
     if not text:
         return
     
     # Simple language detection isn't built-in, default to auto -> auto
-    encoded = urllib.parse.quote(text)
+    encoded = urllib.parse.quote_plus(text, safe="")
     url = f"https://translate.google.com/?sl=auto&tl=auto&text={encoded}&op=translate"
-    
-    # Use gtk_show_uri (GTK4 way via launch_default_for_uri is preferred but this is easier)
-    # Actually, let's use Gtk.FileLauncher or similar, or just xdg-open via python for simplicity
-    import subprocess
-    subprocess.Popen(["xdg-open", url])
+
+    # Hand the URI to the desktop's default handler in-process instead of
+    # spawning xdg-open
+    try:
+        Gio.AppInfo.launch_default_for_uri(url, None)
+    except Exception as e:
+        print(f"[ClipKeeper] Failed to open URI via Gio: {e}")
+        import webbrowser
+        webbrowser.open_new_tab(url)
 
 def show_qr_code(parent_widget, text: str):
     """Show a popover with QR code for the text."""
-    if not HAS_QR or not text:
+    if not text or not _ensure_qr():
         return
 
     popover = Gtk.Popover()
@@ -96,24 +167,22 @@ def show_qr_code(parent_widget, text: str):
     
     try:
         # Generate QR
-        qr = qrcode.QRCode(
-            version=None,
-            error_correction=qrcode.constants.ERROR_CORRECT_L,
-            box_size=8,
-            border=3,
-        )
+        qr = _get_qr()
         qr.add_data(text)
         qr.make(fit=True)
         
-        # Save to temp file to display (simplest way with GTK)
-        import tempfile
-        img = qr.make_image(fill_color="black", back_color="white")
-        
-        fd, path = tempfile.mkstemp(suffix=".png")
-        os.close(fd)
-        img.save(path)
+        # Upload raw RGB pixels straight into a texture (no PNG/temp file round-trip)
+        img = qr.make_image(fill_color="black", back_color="white").convert("RGB")
+        width, height = img.size
+        texture = Gdk.MemoryTexture.new(
+            width,
+            height,
+            Gdk.MemoryFormat.R8G8B8,
+            GLib.Bytes.new(img.tobytes()),
+            width * 3,
+        )
         
-        image = Gtk.Image.new_from_file(path)
+        image = Gtk.Image.new_from_paintable(texture)
         image.set_pixel_size(200)
         box.append(image)
         
@@ -5,6 +5,7 @@ settings, and menu actions.
 """
 
 import os
+import threading
 import time
 
 import gi
@@ -13,6 +14,7 @@ gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
 from gi.repository import Adw, Gdk, Gio, GLib, Gtk
 
+from .content_detector import ContentDetector
 from .database import BACKUPS_DIR, Database
 from .hotkeys import apply_system_hotkey, default_toggle_command, display_hotkey
 from .i18n import set_locale, tr
@@ -22,6 +24,23 @@ from .tray import TrayIndicator
 from .window import ClipKeeperWindow
 
 
+# Pre-encoded accent color overrides, keyed by the "theme_accent" setting
+ACCENT_COLORS = {
+    "blue": "#3584e4",
+    "purple": "#9141ac",
+    "green": "#2ec27e",
+    "orange": "#ff7800",
+    "grey": "#77767b",
+}
+ACCENT_CSS = {
+    name: (
+        f"@define-color accent_bg_color {color};\n"
+        "@define-color accent_fg_color #ffffff;\n"
+    ).encode()
+    for name, color in ACCENT_COLORS.items()
+}
+
+
 class ClipKeeperApp(Adw.Application):
     """Main application class for ClipKeeper with daemon mode."""
 
@@ -39,6 +58,11 @@ class ClipKeeperApp(Adw.Application):
         self._css_provider = None
         self._daemon_mode = daemon_mode
         self._backup_timeout_id = None
+        self._backup_in_flight = False
+        # A manual backup asked for while another one was running
+        self._backup_notify = False
+        self._new_clip_timeout_id = None
+        self._last_accent = None
 
     def do_startup(self):
         Adw.Application.do_startup(self)
@@ -72,6 +96,10 @@ class ClipKeeperApp(Adw.Application):
         """Apply visual settings (theme, compact)."""
         # Accent Color
         accent = self.settings_manager.get("theme_accent")
+        # Skip the CSS reload (and the style recompute it triggers) when nothing changed
+        if accent == self._last_accent:
+            return
+        self._last_accent = accent
         
         if accent == "standard":
             if hasattr(self, "_accent_provider"):
@@ -79,15 +107,6 @@ class ClipKeeperApp(Adw.Application):
                 Gtk.StyleContext.remove_provider_for_display(display, self._accent_provider)
                 delattr(self, "_accent_provider")
             return
-
-        colors = {
-            "blue": "#3584e4",
-            "purple": "#9141ac",
-            "green": "#2ec27e",
-            "orange": "#ff7800",
-            "grey": "#77767b",
-        }
-        color_val = colors.get(accent, "#3584e4")
         
         # Create a provider for accent color override
         if not hasattr(self, "_accent_provider"):
@@ -97,11 +116,7 @@ class ClipKeeperApp(Adw.Application):
                 display, self._accent_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION + 1
             )
             
-        css = f"""
-        @define-color accent_bg_color {color_val};
-        @define-color accent_fg_color #ffffff;
-        """
-        self._accent_provider.load_from_data(css.encode())
+        self._accent_provider.load_from_data(ACCENT_CSS.get(accent, ACCENT_CSS["blue"]))
         
         # Compact Mode (needs window to be created, so this part checks periodically or when window shows)
         pass
@@ -189,9 +204,16 @@ class ClipKeeperApp(Adw.Application):
 
     def _on_new_clip(self, monitor, clip_id):
         """New clipboard entry detected."""
+        # Coalesce bursts of clipboard events into one list/stats refresh
+        if self._new_clip_timeout_id is None:
+            self._new_clip_timeout_id = GLib.timeout_add(150, self._flush_new_clips)
+
+    def _flush_new_clips(self) -> bool:
+        self._new_clip_timeout_id = None
         if self.window and self.window.is_visible():
-            self.window.refresh_list()
+            self.window.schedule_refresh()
         self._update_tray_stats()
+        return False
 
     def _update_tray_stats(self):
         """Update tray icon with current stats."""
@@ -246,8 +268,9 @@ class ClipKeeperApp(Adw.Application):
     def _on_clear_response(self, dialog, response):
         if response == "clear":
             self.db.clear_unpinned()
+            ContentDetector.clear_cache()
             if self.window:
-                self.window.refresh_list()
+                self.window.schedule_refresh()
             self._update_tray_stats()
 
     def _on_export(self, action, param):
@@ -256,7 +279,7 @@ class ClipKeeperApp(Adw.Application):
 
         dialog = Gtk.FileDialog(
             title=tr("app.export.title"),
-            initial_name="clipkeeper_export.json",
+            initial_name="clipkeeper_export.zip",
         )
         dialog.save(self.window, None, self._on_export_done)
 
@@ -265,7 +288,10 @@ class ClipKeeperApp(Adw.Application):
             file = dialog.save_finish(result)
             if file:
                 path = file.get_path()
-                self.db.export_to_json(path)
+                if path.lower().endswith(".json"):
+                    self.db.export_to_json(path)
+                else:
+                    self.db.export_to_zip(path)
                 self._show_toast(
                     tr("app.toast.export_done", filename=os.path.basename(path))
                 )
@@ -283,6 +309,8 @@ class ClipKeeperApp(Adw.Application):
         json_filter = Gtk.FileFilter()
         json_filter.set_name(tr("app.import.filter_json"))
         json_filter.add_pattern("*.json")
+        json_filter.add_pattern("*.zip")
+        json_filter.add_pattern("*.db")
         filters = Gio.ListStore.new(Gtk.FileFilter)
         filters.append(json_filter)
         dialog.set_filters(filters)
@@ -295,7 +323,7 @@ class ClipKeeperApp(Adw.Application):
             if file:
                 path = file.get_path()
                 count = self.db.import_from_json(path)
-                self.window.refresh_list()
+                self.window.schedule_refresh()
                 self._update_tray_stats()
                 self._show_toast(tr("app.toast.import_done", count=count))
         except Exception as e:
@@ -340,21 +368,47 @@ class ClipKeeperApp(Adw.Application):
         return os.path.expanduser(raw or BACKUPS_DIR)
 
     def create_backup(self, silent: bool = True) -> bool:
-        try:
-            keep = max(1, self.settings_manager.get_int("backup_keep_count"))
-            path = self.db.create_backup(self.backup_dir(), keep_files=keep)
-            self.settings_manager.set("backup_last_ts", str(time.time()))
+        """Start a backup in a background thread; the result is reported on the main loop."""
+        if self._backup_in_flight:
+            # Report the running backup's result to the user instead
             if not silent:
-                self._show_toast(
-                    tr("app.toast.backup_done", filename=os.path.basename(path))
-                )
-            return True
+                self._backup_notify = True
+            return False
+        self._backup_in_flight = True
+        keep = max(1, self.settings_manager.get_int("backup_keep_count"))
+        thread = threading.Thread(
+            target=self._backup_worker,
+            args=(self.backup_dir(), keep, silent),
+            daemon=True,
+        )
+        thread.start()
+        return False  # also used as a one-shot GLib.idle_add callback
+
+    def _backup_worker(self, backup_dir: str, keep: int, silent: bool):
+        try:
+            path = self.db.create_backup(backup_dir, keep_files=keep)
+            GLib.idle_add(self._backup_done, path, None, silent)
         except Exception as e:
-            print(f"[ClipKeeper] Backup error: {e}")
+            GLib.idle_add(self._backup_done, None, e, silent)
+
+    def _backup_done(self, path: str | None, error: Exception | None, silent: bool):
+        self._backup_in_flight = False
+        if self._backup_notify:
+            self._backup_notify = False
+            silent = False
+        if error is not None:
+            print(f"[ClipKeeper] Backup error: {error}")
             if not silent:
                 self._show_toast(tr("app.toast.backup_failed"))
             return False
 
+        self.settings_manager.set("backup_last_ts", str(time.time()))
+        if not silent:
+            self._show_toast(
+                tr("app.toast.backup_done", filename=os.path.basename(path))
+            )
+        return False
+
     def reconfigure_backup(self):
         self._setup_backup_timer()
 
@@ -413,6 +467,9 @@ class ClipKeeperApp(Adw.Application):
         if self._backup_timeout_id:
             GLib.source_remove(self._backup_timeout_id)
             self._backup_timeout_id = None
+        if self._new_clip_timeout_id:
+            GLib.source_remove(self._new_clip_timeout_id)
+            self._new_clip_timeout_id = None
         if self.monitor:
             self.monitor.stop()
         if self.tray:
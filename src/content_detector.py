@@ -3,10 +3,22 @@ ClipKeeper — Content Detector.
 Auto-detects content type from text: URLs, emails, phone numbers, code, colors.
 """
 
+import copy
+import hashlib
 import re
+import string
+import threading
+from collections import OrderedDict
 from typing import Optional
 
-from .i18n import tr
+from .i18n import get_locale, tr
+
+try:
+    import hyperscan
+    HAS_HYPERSCAN = True
+except ImportError:
+    hyperscan = None
+    HAS_HYPERSCAN = False
 
 
 # --- Patterns ---
@@ -31,6 +43,17 @@ RGB_COLOR_PATTERN = re.compile(
     r"(?:rgb|hsl)a?\(\s*\d+", re.IGNORECASE
 )
 
+# Combined prefilter for detect(): one Hyperscan pass tells which of these
+# can match at all, `re` still does the exact check. Phone and rgb()/hsl()
+# rely on Unicode \d/\s, which Hyperscan's ASCII classes would miss, so
+# they keep their cheap length-gated checks (hex colors need no regex).
+DETECT_PATTERNS = [URL_PATTERN, EMAIL_PATTERN]
+DETECT_URL, DETECT_EMAIL = range(len(DETECT_PATTERNS))
+
+# Plain str checks for the short color/phone predicates
+HEX_CHARS = frozenset("0123456789abcdefABCDEF")
+PHONE_DROP_TABLE = str.maketrans("", "", "-().+")
+
 # Code detection markers — presence of multiple of these suggests code
 CODE_MARKERS = [
     # Python
@@ -55,6 +78,19 @@ CODE_MARKERS = [
 
 CODE_COMPILED = [re.compile(p, re.MULTILINE | re.IGNORECASE) for p in CODE_MARKERS]
 
+# Code markers are only searched in the head of very large pastes
+CODE_SCAN_LIMIT = 8192
+
+# Language hints only need the head of the snippet
+LANG_SCAN_LIMIT = 4096
+
+# Only clips up to this length are memoized by detect_cached()
+DETECT_CACHE_MAX_LEN = 4096
+DETECT_CACHE_SIZE = 512
+
+# Deletion table for counting special chars with str.translate (runs in C)
+CODE_SPECIAL_TABLE = str.maketrans("", "", "{}[]();=<>|&!@#$%^*~`")
+
 # Language detection (for syntax highlighting hints)
 LANG_HINTS = {
     "python": [r"\bdef\s+\w+\(", r"\bimport\s+\w+", r"\bself\.", r":\s*$"],
@@ -73,6 +109,98 @@ LANG_COMPILED = {
     for lang, patterns in LANG_HINTS.items()
 }
 
+# Flat (language, pattern) list — Hyperscan reports matches by list index
+LANG_PATTERNS = [
+    (lang, pattern) for lang, patterns in LANG_COMPILED.items() for pattern in patterns
+]
+
+# Optional Hyperscan databases, compiled lazily on first use
+_HS_DATABASES: dict = {}
+
+
+def _hyperscan_db(name: str, patterns: list[str]):
+    """Compile patterns into one Hyperscan block-mode database.
+
+    Returns (database, fallback_ids) or None if Hyperscan is unavailable.
+    fallback_ids are patterns Hyperscan rejects (lookarounds) and which
+    still have to be checked with `re`.
+    """
+    if not HAS_HYPERSCAN:
+        return None
+    if name in _HS_DATABASES:
+        return _HS_DATABASES[name]
+
+    flags = (
+        hyperscan.HS_FLAG_CASELESS
+        | hyperscan.HS_FLAG_MULTILINE
+        | hyperscan.HS_FLAG_SINGLEMATCH
+        | hyperscan.HS_FLAG_UTF8
+    )
+    supported, fallback_ids = [], []
+    for idx, pattern in enumerate(patterns):
+        try:
+            probe = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+            probe.compile(expressions=[pattern.encode()], ids=[idx], elements=1, flags=[flags])
+            supported.append(idx)
+        except hyperscan.error:
+            fallback_ids.append(idx)
+
+    result = None
+    try:
+        db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        db.compile(
+            expressions=[patterns[idx].encode() for idx in supported],
+            ids=supported,
+            elements=len(supported),
+            flags=[flags] * len(supported),
+        )
+        result = (db, fallback_ids)
+    except Exception as e:
+        print(f"[ClipKeeper] Hyperscan compile error: {e}")
+    _HS_DATABASES[name] = result
+    return result
+
+
+def _hyperscan_hits(db, text: str, stop_at: Optional[int] = None) -> set[int]:
+    """Scan text once and return the ids of all matched patterns."""
+    hits: set[int] = set()
+
+    def on_match(pattern_id, start, end, flags, context):
+        hits.add(pattern_id)
+        # Returning True terminates the scan early
+        return stop_at is not None and len(hits) >= stop_at
+
+    try:
+        db.scan(text.encode("utf-8", "ignore"), match_event_handler=on_match)
+    except hyperscan.ScanTerminated:
+        pass
+    return hits
+
+# Category display
+CATEGORY_ICONS = {
+    "text": "edit-paste-symbolic",
+    "url": "web-browser-symbolic",
+    "email": "mail-unread-symbolic",
+    "phone": "call-start-symbolic",
+    "code": "utilities-terminal-symbolic",
+    "color": "color-select-symbolic",
+    "image": "image-x-generic-symbolic",
+}
+CATEGORY_LABEL_KEYS = ("all", "text", "url", "email", "phone", "code", "color", "image")
+
+# Translated category labels, built once per locale
+_CATEGORY_LABELS: dict[str, dict[str, str]] = {}
+
+# Sensitive data detection
+AWS_KEY_PATTERN = re.compile(r"AKIA[0-9A-Z]{16}")
+STRIPE_KEY_PATTERN = re.compile(r"(?:sk|pk)_(?:test|live)_[0-9a-zA-Z]{24}")
+GOOGLE_KEY_PATTERN = re.compile(r"AIza[0-9A-Za-z-_]{35}")
+
+UPPER_CHARS = frozenset(string.ascii_uppercase)
+LOWER_CHARS = frozenset(string.ascii_lowercase)
+DIGIT_CHARS = frozenset(string.digits)
+SYMBOL_CHARS = frozenset("!@#$%^&*()_+-=[]{};':\"\\|,.<>/?")
+
 
 class ContentDetector:
     """Detects the category and subtype of clipboard text content."""
@@ -89,26 +217,51 @@ class ContentDetector:
         """
         stripped = text.strip()
         is_sensitive = ContentDetector.detect_sensitive(text)
+        if not stripped:
+            return "text", None, {}, is_sensitive
+
+        # Cheap triage so regexes only run on text that can possibly match
+        head = stripped[:8].lower()
+        hits = ContentDetector._detect_hits(stripped)
 
         # Check for color (short, specific patterns)
         if len(stripped) < 30:
-            if HEX_COLOR_PATTERN.match(stripped):
+            # Same as HEX_COLOR_PATTERN, without the regex engine
+            if (
+                stripped[0] == "#"
+                and len(stripped) in (4, 7)
+                and all(c in HEX_CHARS for c in stripped[1:])
+            ):
                 return "color", "hex", {"color_value": stripped}, is_sensitive
-            if RGB_COLOR_PATTERN.match(stripped):
+            if head.startswith(("rgb", "hsl")) and RGB_COLOR_PATTERN.match(stripped):
                 return "color", "rgb", {"color_value": stripped}, is_sensitive
 
+        has_url = hits is None or DETECT_URL in hits
+
         # Check for URL (if entire text is basically a URL)
-        if ContentDetector._is_url(stripped):
+        if (
+            has_url
+            and head.startswith(("http://", "https://"))
+            and ContentDetector._is_url(stripped)
+        ):
             domain = ContentDetector._extract_domain(stripped)
             # URLs usually aren't sensitive unless they have tokens, but let's trust detect_sensitive
             return "url", domain, {"url": stripped, "domain": domain}, is_sensitive
 
         # Check for email
-        if ContentDetector._is_email(stripped):
+        if (
+            (hits is None or DETECT_EMAIL in hits)
+            and "@" in stripped
+            and ContentDetector._is_email(stripped)
+        ):
             return "email", None, {"email": stripped}, False # Emails usually public id
 
         # Check for phone number (short text that matches phone pattern)
-        if len(stripped) < 25 and ContentDetector._is_phone(stripped):
+        if (
+            len(stripped) < 25
+            and any(c.isdigit() for c in stripped)
+            and ContentDetector._is_phone(stripped)
+        ):
             return "phone", None, {"phone": stripped}, False
 
         # Check for code
@@ -117,21 +270,65 @@ class ContentDetector:
             return "code", language, {"language": language}, is_sensitive
 
         # Check if text contains URLs (mixed content)
-        urls = URL_PATTERN.findall(stripped)
+        urls = URL_PATTERN.findall(stripped) if has_url else None
         if urls:
             return "text", "with_urls", {"urls": urls[:5]}, is_sensitive
 
         return "text", None, {}, is_sensitive
 
     @staticmethod
-    def _is_url(text: str) -> bool:
-        """Check if the text is primarily a URL."""
-        lines = text.strip().split("\n")
+    def detect_cached(text: str) -> tuple[str, Optional[str], dict, bool]:
+        """Same as detect(), memoized for recently seen short clips."""
+        if len(text) > DETECT_CACHE_MAX_LEN:
+            return ContentDetector.detect(text)
+        # Keyed by a digest so the cache never holds the clip text itself
+        key = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        with _detect_cache_lock:
+            hit = _detect_cache.get(key)
+            if hit is not None:
+                _detect_cache.move_to_end(key)
+        if hit is None:
+            result = ContentDetector.detect(text)
+            # Sensitive clips (passwords, keys) are never kept around
+            if result[3]:
+                return result
+            hit = (result[0], result[1], copy.deepcopy(result[2]), result[3])
+            with _detect_cache_lock:
+                _detect_cache[key] = hit
+                if len(_detect_cache) > DETECT_CACHE_SIZE:
+                    _detect_cache.popitem(last=False)
+        category, subtype, metadata, is_sensitive = hit
+        # Callers get their own metadata (nested lists included)
+        return category, subtype, copy.deepcopy(metadata), is_sensitive
+
+    @staticmethod
+    def clear_cache():
+        """Forget memoized results, e.g. after clips were deleted."""
+        with _detect_cache_lock:
+            _detect_cache.clear()
+
+    @staticmethod
+    def _detect_hits(text: str) -> Optional[set[int]]:
+        """Return DETECT_PATTERNS ids that may match, or None without Hyperscan."""
+        hs_db = _hyperscan_db("detect", [p.pattern for p in DETECT_PATTERNS])
+        if hs_db is None:
+            return None
+        db, fallback_ids = hs_db
+        hits = _hyperscan_hits(db, text)
+        # Patterns Hyperscan rejected can't be ruled out
+        hits.update(fallback_ids)
+        return hits
+
+    @staticmethod
+    def _is_url(stripped: str) -> bool:
+        """Check if the (already stripped) text is primarily a URL."""
+        # maxsplit: only need to know whether there are more than 3 lines
+        lines = stripped.split("\n", 3)
         if len(lines) > 3:
             return False
         # Single URL or URL with minimal surrounding text
-        stripped = lines[0].strip()
-        return bool(URL_PATTERN.match(stripped)) and len(stripped) < 2048
+        first_line = lines[0].strip()
+        return bool(URL_PATTERN.match(first_line)) and len(first_line) < 2048
 
     @staticmethod
     def _extract_domain(url: str) -> str:
@@ -149,19 +346,18 @@ class ContentDetector:
             return ""
 
     @staticmethod
-    def _is_email(text: str) -> bool:
-        """Check if text is primarily an email address."""
-        stripped = text.strip()
+    def _is_email(stripped: str) -> bool:
+        """Check if the (already stripped) text is primarily an email address."""
         if "\n" in stripped or len(stripped) > 254:
             return False
         return bool(EMAIL_PATTERN.fullmatch(stripped))
 
     @staticmethod
-    def _is_phone(text: str) -> bool:
-        """Check if text is a phone number."""
-        stripped = text.strip()
-        # Remove common phone formatting chars
-        digits_only = re.sub(r"[\s\-\(\)\.\+]", "", stripped)
+    def _is_phone(stripped: str) -> bool:
+        """Check if the (already stripped) text is a phone number."""
+        # Remove common phone formatting chars (split() drops the same
+        # whitespace as \s)
+        digits_only = "".join(stripped.split()).translate(PHONE_DROP_TABLE)
         if not digits_only.isdigit():
             return False
         if len(digits_only) < 7 or len(digits_only) > 15:
@@ -174,23 +370,41 @@ class ContentDetector:
         if len(text) < 10:
             return False
 
+        head = text[:CODE_SCAN_LIMIT]
         score = 0
-        for pattern in CODE_COMPILED:
-            if pattern.search(text):
+        patterns = CODE_COMPILED
+
+        # Hyperscan matches all markers in a single pass over the text
+        hs_db = _hyperscan_db("code", CODE_MARKERS)
+        if hs_db is not None:
+            db, fallback_ids = hs_db
+            score = len(_hyperscan_hits(db, head, stop_at=2))
+            if score >= 2:
+                return True
+            patterns = [CODE_COMPILED[idx] for idx in fallback_ids]
+
+        for pattern in patterns:
+            if pattern.search(head):
                 score += 1
                 if score >= 2:
                     return True
 
         # High ratio of special chars also suggests code
-        special = sum(1 for c in text if c in "{}[]();=<>|&!@#$%^*~`")
+        special = len(text) - len(text.translate(CODE_SPECIAL_TABLE))
         if len(text) > 0 and special / len(text) > 0.08:
             score += 1
 
+        # The indentation check adds at most one point
+        if score == 0:
+            return False
+
         # Multiple lines with consistent indentation suggests code
-        lines = text.split("\n")
-        if len(lines) >= 3:
-            indented = sum(1 for line in lines if line.startswith(("  ", "\t")))
-            if indented / len(lines) > 0.4:
+        newlines = text.count("\n")
+        if newlines >= 2:
+            indented = text.count("\n  ") + text.count("\n\t")
+            if text.startswith(("  ", "\t")):
+                indented += 1
+            if indented / (newlines + 1) > 0.4:
                 score += 1
 
         return score >= 2
@@ -198,11 +412,23 @@ class ContentDetector:
     @staticmethod
     def _detect_language(text: str) -> Optional[str]:
         """Try to detect the programming language of code."""
+        head = text[:LANG_SCAN_LIMIT]
         scores = {}
-        for lang, patterns in LANG_COMPILED.items():
-            score = sum(1 for p in patterns if p.search(text))
-            if score > 0:
-                scores[lang] = score
+        hs_db = _hyperscan_db("lang", [p.pattern for _, p in LANG_PATTERNS])
+        if hs_db is not None:
+            db, fallback_ids = hs_db
+            hits = _hyperscan_hits(db, head)
+            hits.update(idx for idx in fallback_ids if LANG_PATTERNS[idx][1].search(head))
+            # Tally in LANG_HINTS order so ties resolve like the re path
+            for lang in LANG_HINTS:
+                score = sum(1 for idx in hits if LANG_PATTERNS[idx][0] == lang)
+                if score > 0:
+                    scores[lang] = score
+        else:
+            for lang, patterns in LANG_COMPILED.items():
+                score = sum(1 for p in patterns if p.search(head))
+                if score > 0:
+                    scores[lang] = score
 
         if not scores:
             return None
@@ -211,30 +437,17 @@ class ContentDetector:
     @staticmethod
     def get_category_icon(category: str) -> str:
         """Get display icon for a category."""
-        icons = {
-            "text": "edit-paste-symbolic",
-            "url": "web-browser-symbolic",
-            "email": "mail-unread-symbolic",
-            "phone": "call-start-symbolic",
-            "code": "utilities-terminal-symbolic",
-            "color": "color-select-symbolic",
-            "image": "image-x-generic-symbolic",
-        }
-        return icons.get(category, "edit-paste-symbolic")
+        return CATEGORY_ICONS.get(category, "edit-paste-symbolic")
 
     @staticmethod
     def get_category_label(category: str) -> str:
         """Get display label for a category."""
-        labels = {
-            "all": tr("detector.all"),
-            "text": tr("detector.text"),
-            "url": tr("detector.url"),
-            "email": tr("detector.email"),
-            "phone": tr("detector.phone"),
-            "code": tr("detector.code"),
-            "color": tr("detector.color"),
-            "image": tr("detector.image"),
-        }
+        locale = get_locale()
+        labels = _CATEGORY_LABELS.get(locale)
+        if labels is None:
+            labels = _CATEGORY_LABELS[locale] = {
+                key: tr(f"detector.{key}") for key in CATEGORY_LABEL_KEYS
+            }
         return labels.get(category, category.title())
 
     @staticmethod
@@ -249,26 +462,39 @@ class ContentDetector:
             
         # 2. Common API Key Patterns
         # AWS Access Key ID
-        if re.search(r"AKIA[0-9A-Z]{16}", text):
+        if AWS_KEY_PATTERN.search(text):
             return True
         # Stripe
-        if re.search(r"(?:sk|pk)_(?:test|live)_[0-9a-zA-Z]{24}", text):
+        if STRIPE_KEY_PATTERN.search(text):
             return True
         # Google API Key (loose)
-        if re.search(r"AIza[0-9A-Za-z-_]{35}", text):
+        if GOOGLE_KEY_PATTERN.search(text):
             return True
         
         # 3. High Entropy Strings (Potential Passwords/Tokens)
         # No spaces, mixed case, numbers, symbols, length > 12
         stripped = text.strip()
         if " " not in stripped and len(stripped) > 12 and len(stripped) < 128:
-            has_upper = bool(re.search(r"[A-Z]", stripped))
-            has_lower = bool(re.search(r"[a-z]", stripped))
-            has_digit = bool(re.search(r"\d", stripped))
-            has_symbol = bool(re.search(r"[!@#$%^&*()_+\-=\[\]{};':\"\\|,.<>/?]", stripped))
-            
-            # Strong password criteria
-            if has_upper and has_lower and has_digit and has_symbol:
-                return True
+            # Single pass over the characters, stop once all classes are seen
+            has_upper = has_lower = has_digit = has_symbol = False
+            for c in stripped:
+                if c in UPPER_CHARS:
+                    has_upper = True
+                elif c in LOWER_CHARS:
+                    has_lower = True
+                elif c in DIGIT_CHARS:
+                    has_digit = True
+                elif c in SYMBOL_CHARS:
+                    has_symbol = True
+                else:
+                    continue
+                # Strong password criteria
+                if has_upper and has_lower and has_digit and has_symbol:
+                    return True
                 
         return False
+
+
+# detect_cached() results by text digest, least recently used first
+_detect_cache: "OrderedDict[bytes, tuple[str, Optional[str], dict, bool]]" = OrderedDict()
+_detect_cache_lock = threading.Lock()
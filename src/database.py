@@ -6,36 +6,171 @@ categories, collections, settings, and export/import.
 
 import base64
 import binascii
+import functools
 import json
+import mmap
 import os
+import queue
+import shutil
 import sqlite3
+import threading
 import time
+import urllib.parse
+import zipfile
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional
 
+try:
+    import pybase64
+    HAS_PYBASE64 = True
+except ImportError:
+    pybase64 = None
+    HAS_PYBASE64 = False
+
 
 DATA_DIR = os.path.expanduser("~/.local/share/clipkeeper")
 DB_PATH = os.path.join(DATA_DIR, "history.db")
 IMAGES_DIR = os.path.join(DATA_DIR, "images")
 BACKUPS_DIR = os.path.join(DATA_DIR, "backups")
 
+# Full-text search needs at least one trigram; shorter queries use LIKE
+FTS_MIN_QUERY_LEN = 3
+
+# Manifest entry of ZIP exports (images are stored next to it as raw files)
+EXPORT_MANIFEST = "manifest.json"
+
+# Backups are SQLite snapshots; their image files are hard-linked into a
+# sibling directory named <snapshot without .db> + this suffix
+BACKUP_PREFIX = "clipkeeper_backup_"
+BACKUP_IMAGES_SUFFIX = ".images"
+SQLITE_HEADER = b"SQLite format 3\x00"
+
+# content_hash is stored as the raw SHA-256 digest (BLOB, half the size of
+# hex text); callers still see hex strings through this expression
+HASH_HEX_SQL = (
+    "CASE WHEN typeof(content_hash) = 'blob' THEN lower(hex(content_hash)) "
+    "ELSE content_hash END AS content_hash"
+)
+
+# pybase64's SIMD codec only pays off above a few dozen bytes
+B64_SIMD_MIN = 64
+
+# Legacy image BLOBs are copied out in pieces of this size
+BLOB_CHUNK_SIZE = 1024 * 1024
+
+# Bulk file removals of this many paths or more are spread over threads
+UNLINK_PARALLEL_MIN = 64
+
+# Prepared statements kept by sqlite3 (get_clips() builds many filter variants)
+SQL_CACHE_SIZE = 256
+
+# Fixed SQL used on hot paths; identical strings hit the statement cache
+INSERT_CLIP_SQL = """
+    INSERT INTO clips (
+        content_type, category, content_subtype,
+        text_content, image_path, thumb_path,
+        preview, metadata_json, content_hash,
+        image_width, image_height, is_sensitive,
+        used_at, created_at
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(content_hash) DO UPDATE SET
+        used_at = excluded.used_at, use_count = clips.use_count + 1
+    RETURNING id, created_at
+"""
+
+IMPORT_CLIP_SQL = """
+    INSERT OR IGNORE INTO clips (
+        content_type, category, content_subtype,
+        text_content, image_path, thumb_path,
+        preview, metadata_json, content_hash,
+        image_width, image_height, is_sensitive,
+        pinned, favorite, is_snippet, use_count,
+        used_at, created_at, collection_id
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+TOGGLE_SQL = {
+    column: (
+        f"UPDATE clips SET {column} = CASE WHEN {column} THEN 0 ELSE 1 END "
+        f"WHERE id = ? RETURNING {column}"
+    )
+    for column in ("pinned", "favorite", "is_snippet")
+}
+
+# The writer thread commits queued writes in one transaction: at most this
+# many per batch, stopping early once a batch has run WRITE_BATCH_WINDOW seconds
+WRITE_BATCH_SIZE = 50
+WRITE_BATCH_WINDOW = 0.005
+
+# Refresh query planner statistics at most this often (seconds)
+OPTIMIZE_INTERVAL = 15 * 60
+
+
+def _write_op(method):
+    """Run a Database method on the writer thread and wait for its result."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        return self._write(functools.partial(method, self, *args, **kwargs))
+
+    return wrapper
+
 
 class Database:
-    """SQLite database for storing clipboard history."""
+    """SQLite database for storing clipboard history.
+
+    All writes go through one writer thread that owns self.conn; reads use a
+    read-only connection per thread, so they never wait on the write lock.
+    """
+
+    # Directories already ensured by this process
+    _ensured_dirs: set[str] = set()
 
     def __init__(self, db_path: str = DB_PATH):
-        os.makedirs(os.path.dirname(db_path), exist_ok=True)
-        os.makedirs(IMAGES_DIR, exist_ok=True)
         self.db_path = db_path
         self.images_dir = IMAGES_DIR
         self.backups_dir = os.path.join(os.path.dirname(db_path), "backups")
-        os.makedirs(self.backups_dir, exist_ok=True)
-        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._ensure_dirs(os.path.dirname(db_path), IMAGES_DIR, self.backups_dir)
+        self.conn = sqlite3.connect(
+            db_path, check_same_thread=False, cached_statements=SQL_CACHE_SIZE
+        )
         self.conn.row_factory = sqlite3.Row
         self.conn.execute("PRAGMA journal_mode=WAL")
+        # NORMAL under WAL never corrupts the database, but commits are only
+        # fsynced at checkpoints: a power loss or OS crash can roll back the
+        # most recent transactions (an app crash alone cannot)
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+        self.conn.execute("PRAGMA cache_size=-65536")  # 64 MiB
+        self.conn.execute("PRAGMA busy_timeout=5000")
         self.conn.execute("PRAGMA foreign_keys=ON")
+        self._last_optimize = time.monotonic()
         self._create_tables()
         self._migrate()
         self._create_indexes()
+        self.has_fts = self._create_fts()
+
+        self._ro_uri = "file:" + urllib.parse.quote(os.path.abspath(db_path)) + "?mode=ro"
+        self._local = threading.local()
+        self._wq: queue.SimpleQueue = queue.SimpleQueue()
+        # Set by close(); guarded so no job is queued behind the stop sentinel
+        self._closed = False
+        self._close_lock = threading.Lock()
+        self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer_thread.start()
+
+    @classmethod
+    def _ensure_dirs(cls, *paths: str):
+        """Create missing directories, at most one stat per path per process."""
+        for path in paths:
+            if path in cls._ensured_dirs:
+                continue
+            if not os.path.isdir(path):
+                os.makedirs(path, exist_ok=True)
+            cls._ensured_dirs.add(path)
 
     def _create_tables(self):
         """Create tables only — indexes are created after migration."""
@@ -86,11 +221,64 @@ class Database:
             CREATE INDEX IF NOT EXISTS idx_clips_used_at ON clips(used_at DESC);
             CREATE INDEX IF NOT EXISTS idx_clips_pinned ON clips(pinned DESC);
             CREATE INDEX IF NOT EXISTS idx_clips_category ON clips(category);
-            CREATE INDEX IF NOT EXISTS idx_clips_hash ON clips(content_hash);
+            -- content_hash is UNIQUE, its automatic index already serves lookups
+            DROP INDEX IF EXISTS idx_clips_hash;
             CREATE INDEX IF NOT EXISTS idx_clips_favorite ON clips(favorite DESC);
+            -- Match get_clips() ORDER BY so the list needs no sort step
+            CREATE INDEX IF NOT EXISTS idx_clips_pinned_used ON clips(pinned DESC, used_at DESC);
+            CREATE INDEX IF NOT EXISTS idx_clips_fav_used
+                ON clips(pinned DESC, used_at DESC) WHERE favorite = 1;
+            CREATE INDEX IF NOT EXISTS idx_clips_snippet_used
+                ON clips(pinned DESC, used_at DESC) WHERE is_snippet = 1;
+            CREATE INDEX IF NOT EXISTS idx_clips_category_used
+                ON clips(category, pinned DESC, used_at DESC);
         """)
         self.conn.commit()
 
+    def _create_fts(self) -> bool:
+        """Create the FTS5 search index over text_content/preview.
+
+        The trigram tokenizer keeps substring semantics of the old LIKE
+        search. Returns False if this SQLite build lacks FTS5/trigram.
+        """
+        exists = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'clips_fts'"
+        ).fetchone()
+        try:
+            self.conn.executescript("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS clips_fts USING fts5(
+                    text_content, preview,
+                    content='clips', content_rowid='id', tokenize='trigram'
+                );
+
+                CREATE TRIGGER IF NOT EXISTS clips_fts_ai AFTER INSERT ON clips BEGIN
+                    INSERT INTO clips_fts(rowid, text_content, preview)
+                    VALUES (new.id, new.text_content, new.preview);
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS clips_fts_ad AFTER DELETE ON clips BEGIN
+                    INSERT INTO clips_fts(clips_fts, rowid, text_content, preview)
+                    VALUES ('delete', old.id, old.text_content, old.preview);
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS clips_fts_au
+                AFTER UPDATE OF text_content, preview ON clips BEGIN
+                    INSERT INTO clips_fts(clips_fts, rowid, text_content, preview)
+                    VALUES ('delete', old.id, old.text_content, old.preview);
+                    INSERT INTO clips_fts(rowid, text_content, preview)
+                    VALUES (new.id, new.text_content, new.preview);
+                END;
+            """)
+            if not exists:
+                # Index clips stored before the search table existed
+                self.conn.execute("INSERT INTO clips_fts(clips_fts) VALUES ('rebuild')")
+            self.conn.commit()
+            return True
+        except sqlite3.OperationalError as e:
+            self.conn.rollback()
+            print(f"[Database] FTS5 unavailable, using LIKE search: {e}")
+            return False
+
     def _migrate(self):
         """Handle schema migrations from older versions."""
         cursor = self.conn.execute("PRAGMA table_info(clips)")
@@ -143,43 +331,64 @@ class Database:
             self._migrate_images()
 
         # Normalize legacy timestamp/text values to REAL unix timestamps.
-        self.conn.executescript(
-            """
-            UPDATE clips
-            SET created_at = CAST(strftime('%s', created_at) AS REAL)
-            WHERE typeof(created_at) = 'text' AND created_at LIKE '____-__-__%';
-
-            UPDATE clips
-            SET used_at = CAST(strftime('%s', used_at) AS REAL)
-            WHERE typeof(used_at) = 'text' AND used_at LIKE '____-__-__%';
-
-            UPDATE clips
-            SET created_at = CAST(created_at AS REAL)
-            WHERE typeof(created_at) = 'text' AND created_at GLOB '[0-9]*';
-
-            UPDATE clips
-            SET used_at = CAST(used_at AS REAL)
-            WHERE typeof(used_at) = 'text' AND used_at GLOB '[0-9]*';
-
-            UPDATE clips
-            SET used_at = created_at
-            WHERE used_at IS NULL;
-            """
-        )
+        # One pass converts both columns; databases without text values
+        # (everything written by current versions) skip it entirely.
+        has_text_timestamps = self.conn.execute(
+            """SELECT 1 FROM clips
+               WHERE typeof(created_at) = 'text' OR typeof(used_at) = 'text'
+               LIMIT 1"""
+        ).fetchone()
+        if has_text_timestamps:
+            self.conn.execute(
+                """
+                UPDATE clips
+                SET created_at = CASE
+                        WHEN typeof(created_at) != 'text' THEN created_at
+                        WHEN created_at LIKE '____-__-__%'
+                            THEN CAST(strftime('%s', created_at) AS REAL)
+                        WHEN created_at GLOB '[0-9]*' THEN CAST(created_at AS REAL)
+                        ELSE created_at
+                    END,
+                    used_at = CASE
+                        WHEN typeof(used_at) != 'text' THEN used_at
+                        WHEN used_at LIKE '____-__-__%'
+                            THEN CAST(strftime('%s', used_at) AS REAL)
+                        WHEN used_at GLOB '[0-9]*' THEN CAST(used_at AS REAL)
+                        ELSE used_at
+                    END
+                WHERE typeof(created_at) = 'text' OR typeof(used_at) = 'text'
+                """
+            )
+
+        self.conn.execute("UPDATE clips SET used_at = created_at WHERE used_at IS NULL")
+
+        # Hex text hashes from older versions -> raw digest BLOBs
+        text_hashes = self.conn.execute(
+            "SELECT id, content_hash FROM clips WHERE typeof(content_hash) = 'text'"
+        ).fetchall()
+        converted = [
+            (key, row["id"])
+            for row in text_hashes
+            if isinstance(key := self._hash_key(row["content_hash"]), bytes)
+        ]
+        if converted:
+            self.conn.executemany("UPDATE clips SET content_hash = ? WHERE id = ?", converted)
 
         self.conn.commit()
 
     def _migrate_images(self):
         """Migrate BLOB images to filesystem."""
         try:
+            # Only ids here: image bytes are streamed one row at a time
             rows = self.conn.execute(
-                "SELECT id, image_data, content_hash FROM clips WHERE image_data IS NOT NULL"
+                f"""SELECT id, {HASH_HEX_SQL} FROM clips
+                   WHERE image_data IS NOT NULL AND length(image_data) > 0"""
             ).fetchall()
             for row in rows:
-                if row["image_data"] and row["content_hash"]:
+                if row["content_hash"]:
                     img_path = os.path.join(self.images_dir, f"{row['content_hash']}.png")
                     with open(img_path, "wb") as f:
-                        f.write(row["image_data"])
+                        self._copy_image_blob(row["id"], f)
                     self.conn.execute(
                         "UPDATE clips SET image_path = ? WHERE id = ?",
                         (img_path, row["id"]),
@@ -187,8 +396,21 @@ class Database:
         except Exception as e:
             print(f"[ClipKeeper] Image migration error: {e}")
 
+    def _copy_image_blob(self, clip_id: int, out):
+        """Write a legacy image_data BLOB to a file in BLOB_CHUNK_SIZE pieces."""
+        if not hasattr(self.conn, "blobopen"):  # Python < 3.11
+            row = self.conn.execute(
+                "SELECT image_data FROM clips WHERE id = ?", (clip_id,)
+            ).fetchone()
+            out.write(row["image_data"])
+            return
+        with self.conn.blobopen("clips", "image_data", clip_id, readonly=True) as blob:
+            while chunk := blob.read(BLOB_CHUNK_SIZE):
+                out.write(chunk)
+
     # --- Clips CRUD ---
 
+    @_write_op
     def add_clip(
         self,
         content_type: str,
@@ -204,57 +426,38 @@ class Database:
         metadata: Optional[dict] = None,
         is_sensitive: bool = False,
     ) -> Optional[int]:
-        """Add a new clip to the database."""
-        try:
-            metadata_json = json.dumps(metadata) if metadata else None
-            now = time.time()
-            
-            cursor = self.conn.execute(
-                """
-                INSERT INTO clips (
-                    content_type, category, content_subtype,
-                    text_content, image_path, thumb_path,
-                    preview, metadata_json, content_hash,
-                    image_width, image_height, is_sensitive,
-                    used_at, created_at
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    content_type,
-                    category,
-                    content_subtype,
-                    text_content,
-                    image_path,
-                    thumb_path,
-                    preview,
-                    metadata_json,
-                    content_hash,
-                    image_width,
-                    image_height,
-                    is_sensitive,
-                    now,
-                    now,
-                ),
-            )
-            self.conn.commit()
+        """Add a new clip to the database.
+
+        A clip whose hash already exists is bumped instead (used_at, use_count).
+        """
+        metadata_json = json.dumps(metadata) if metadata else None
+        now = time.time()
+
+        row = self.conn.execute(
+            INSERT_CLIP_SQL,
+            (
+                content_type,
+                category,
+                content_subtype,
+                text_content,
+                image_path,
+                thumb_path,
+                preview,
+                metadata_json,
+                self._hash_key(content_hash),
+                image_width,
+                image_height,
+                is_sensitive,
+                now,
+                now,
+            ),
+        ).fetchone()
+        if row is None:
+            return None
+        # A bumped duplicate keeps its original created_at
+        if row["created_at"] == now:
             self._auto_cleanup(self._max_history_limit())
-            return cursor.lastrowid
-        except sqlite3.IntegrityError:
-            # Duplicate content hash -> update used_at
-            # We also might want to check if sensitive status changed? 
-            # E.g. content was updated? No, hash is same.
-            self.conn.execute(
-                "UPDATE clips SET used_at = ?, use_count = use_count + 1 WHERE content_hash = ?",
-                (time.time(), content_hash),
-            )
-            self.conn.commit()
-            
-            # Fetch the ID
-            row = self.conn.execute(
-                "SELECT id FROM clips WHERE content_hash = ?", (content_hash,)
-            ).fetchone()
-            return row["id"] if row else None
+        return row["id"]
 
     def get_clips(
         self,
@@ -264,12 +467,21 @@ class Database:
         snippets_only: bool = False,
         collection_id: Optional[int] = None,
         limit: int = 100,
-    ) -> list[sqlite3.Row]:
-        """Get clips with optional filtering."""
+        as_dicts: bool = False,
+    ) -> list:
+        """Get clips with optional filtering.
+
+        as_dicts=True returns plain dicts built from raw tuples, cheaper than
+        sqlite3.Row objects the caller would convert anyway.
+        """
         conditions = []
         params = []
 
-        if search:
+        if search and self.has_fts and len(search) >= FTS_MIN_QUERY_LEN:
+            conditions.append("id IN (SELECT rowid FROM clips_fts WHERE clips_fts MATCH ?)")
+            # Quoted FTS5 string: matched as a literal substring
+            params.append('"' + search.replace('"', '""') + '"')
+        elif search:
             conditions.append("(text_content LIKE ? OR preview LIKE ?)")
             pattern = f"%{search}%"
             params.extend([pattern, pattern])
@@ -294,91 +506,83 @@ class Database:
             SELECT id, content_type, category, content_subtype, text_content,
                    image_path, thumb_path, image_width, image_height,
                    preview, metadata_json, pinned, favorite, is_snippet, is_sensitive, collection_id,
-                   created_at, used_at, use_count, content_hash
+                   created_at, used_at, use_count, {HASH_HEX_SQL}
             FROM clips
             {where}
             ORDER BY pinned DESC, used_at DESC
             LIMIT ?
         """
         params.append(limit)
-        return self.conn.execute(query, params).fetchall()
+        conn = self._reader()
+        if not as_dicts:
+            return conn.execute(query, params).fetchall()
+
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        rows = cursor.execute(query, params).fetchall()
+        names = [column[0] for column in cursor.description]
+        return [dict(zip(names, row)) for row in rows]
 
     def get_clip_by_id(self, clip_id: int) -> Optional[sqlite3.Row]:
-        return self.conn.execute(
-            """SELECT id, content_type, category, content_subtype, text_content,
+        return self._reader().execute(
+            f"""SELECT id, content_type, category, content_subtype, text_content,
                       image_path, thumb_path, image_width, image_height,
                       preview, metadata_json, pinned, favorite, is_snippet, is_sensitive, collection_id,
-                      created_at, used_at, use_count, content_hash
+                      created_at, used_at, use_count, {HASH_HEX_SQL}
                FROM clips WHERE id = ?""",
             (clip_id,),
         ).fetchone()
 
+    @_write_op
     def delete_clip(self, clip_id: int):
         """Delete a clip and its image files."""
         clip = self.get_clip_by_id(clip_id)
         if clip:
-            for path_field in ("image_path", "thumb_path"):
-                path = clip[path_field]
-                if path and os.path.exists(path):
-                    try:
-                        os.remove(path)
-                    except OSError:
-                        pass
+            self._remove_clip_files([clip])
         self.conn.execute("DELETE FROM clips WHERE id = ?", (clip_id,))
-        self.conn.commit()
+
+    @_write_op
+    def _toggle_flag(self, column: str, clip_id: int) -> bool:
+        """Flip a boolean column in one statement and return the new state."""
+        row = self.conn.execute(TOGGLE_SQL[column], (clip_id,)).fetchone()
+        return bool(row[0]) if row else False
 
     def toggle_pin(self, clip_id: int) -> bool:
-        row = self.conn.execute("SELECT pinned FROM clips WHERE id = ?", (clip_id,)).fetchone()
-        if not row:
-            return False
-        new_state = 0 if row["pinned"] else 1
-        self.conn.execute("UPDATE clips SET pinned = ? WHERE id = ?", (new_state, clip_id))
-        self.conn.commit()
-        return bool(new_state)
+        return self._toggle_flag("pinned", clip_id)
 
     def toggle_snippet(self, clip_id: int) -> bool:
-        row = self.conn.execute("SELECT is_snippet FROM clips WHERE id = ?", (clip_id,)).fetchone()
-        if not row:
-            return False
-        new_state = 0 if row["is_snippet"] else 1
-        self.conn.execute("UPDATE clips SET is_snippet = ? WHERE id = ?", (new_state, clip_id))
-        self.conn.commit()
-        return bool(new_state)
+        return self._toggle_flag("is_snippet", clip_id)
 
     def toggle_favorite(self, clip_id: int) -> bool:
-        row = self.conn.execute("SELECT favorite FROM clips WHERE id = ?", (clip_id,)).fetchone()
-        if not row:
-            return False
-        new_state = 0 if row["favorite"] else 1
-        self.conn.execute("UPDATE clips SET favorite = ? WHERE id = ?", (new_state, clip_id))
-        self.conn.commit()
-        return bool(new_state)
+        return self._toggle_flag("favorite", clip_id)
 
+    @_write_op
     def set_collection(self, clip_id: int, collection_id: Optional[int]):
         self.conn.execute(
             "UPDATE clips SET collection_id = ? WHERE id = ?", (collection_id, clip_id)
         )
-        self.conn.commit()
 
+    @_write_op
     def update_used_at(self, clip_id: int):
         self.conn.execute(
             "UPDATE clips SET used_at = ?, use_count = use_count + 1 WHERE id = ?",
             (time.time(), clip_id),
         )
-        self.conn.commit()
 
+    @_write_op
     def update_metadata(self, clip_id: int, metadata: dict):
-        """Update metadata for a clip (e.g., page title for URLs)."""
-        existing = self.get_clip_by_id(clip_id)
-        if existing:
-            old_meta = json.loads(existing["metadata_json"]) if existing["metadata_json"] else {}
-            old_meta.update(metadata)
-            self.conn.execute(
-                "UPDATE clips SET metadata_json = ? WHERE id = ?",
-                (json.dumps(old_meta), clip_id),
-            )
-            self.conn.commit()
+        """Update metadata for a clip (e.g., page title for URLs).
 
+        Keys are merged in SQL with json_patch (RFC 7396): nested objects are
+        merged and a None value removes the key.
+        """
+        self.conn.execute(
+            "UPDATE clips SET metadata_json = json_patch(COALESCE(metadata_json, '{}'), ?) "
+            "WHERE id = ?",
+            (json.dumps(metadata), clip_id),
+        )
+
+    @_write_op
     def update_clip_text(self, clip_id: int, new_text: str):
         """Update the text content of a clip."""
         # We also need to update the hash and preview
@@ -391,9 +595,8 @@ class Database:
                 """UPDATE clips 
                    SET text_content = ?, content_hash = ?, preview = ? 
                    WHERE id = ?""",
-                (new_text, new_hash, new_preview, clip_id),
+                (new_text, self._hash_key(new_hash), new_preview, clip_id),
             )
-            self.conn.commit()
             return True
         except sqlite3.IntegrityError:
             # Hash collision (content already exists elsewhere)?
@@ -404,87 +607,92 @@ class Database:
             # But that's complex. Let's just return False for now.
             return False
 
+    @_write_op
     def clear_unpinned(self):
         """Delete all unpinned, non-favorite clips and their images."""
         clips = self.conn.execute(
             "SELECT image_path, thumb_path FROM clips WHERE pinned = 0 AND favorite = 0"
         ).fetchall()
-        for clip in clips:
-            for path_field in ("image_path", "thumb_path"):
-                path = clip[path_field]
-                if path and os.path.exists(path):
-                    try:
-                        os.remove(path)
-                    except OSError:
-                        pass
+        self._remove_clip_files(clips)
         self.conn.execute("DELETE FROM clips WHERE pinned = 0 AND favorite = 0")
-        self.conn.commit()
 
     # --- Collections ---
 
+    @_write_op
     def create_collection(self, name: str, icon: str = "📁", color: str = "#3584e4") -> int:
         cursor = self.conn.execute(
             "INSERT OR IGNORE INTO collections (name, icon, color, created_at) VALUES (?, ?, ?, ?)",
             (name, icon, color, time.time()),
         )
-        self.conn.commit()
         return cursor.lastrowid
 
     def get_collections(self) -> list[sqlite3.Row]:
-        return self.conn.execute(
+        return self._reader().execute(
             "SELECT * FROM collections ORDER BY name"
         ).fetchall()
 
+    @_write_op
     def delete_collection(self, collection_id: int):
         self.conn.execute(
             "UPDATE clips SET collection_id = NULL WHERE collection_id = ?", (collection_id,)
         )
         self.conn.execute("DELETE FROM collections WHERE id = ?", (collection_id,))
-        self.conn.commit()
 
     # --- Settings ---
 
     def get_setting(self, key: str, default: str = "") -> str:
-        row = self.conn.execute("SELECT value FROM settings WHERE key = ?", (key,)).fetchone()
+        row = self._reader().execute(
+            "SELECT value FROM settings WHERE key = ?", (key,)
+        ).fetchone()
         return row["value"] if row else default
 
+    @_write_op
     def set_setting(self, key: str, value: str):
         self.conn.execute(
             "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)", (key, value)
         )
-        self.conn.commit()
 
     def get_all_settings(self) -> dict:
-        rows = self.conn.execute("SELECT key, value FROM settings").fetchall()
+        rows = self._reader().execute("SELECT key, value FROM settings").fetchall()
         return {row["key"]: row["value"] for row in rows}
 
     # --- Stats ---
 
     def get_stats(self) -> dict:
-        total = self.conn.execute("SELECT COUNT(*) as c FROM clips").fetchone()["c"]
-        pinned = self.conn.execute("SELECT COUNT(*) as c FROM clips WHERE pinned = 1").fetchone()["c"]
-        favorites = self.conn.execute("SELECT COUNT(*) as c FROM clips WHERE favorite = 1").fetchone()["c"]
-        images = self.conn.execute("SELECT COUNT(*) as c FROM clips WHERE content_type = 'image'").fetchone()["c"]
-        categories = self.conn.execute(
-            "SELECT category, COUNT(*) as c FROM clips GROUP BY category"
+        # One scan: per-category counts with conditional sums, totalled here
+        rows = self._reader().execute(
+            """SELECT category, COUNT(*) as c,
+                      TOTAL(pinned = 1) as pinned,
+                      TOTAL(favorite = 1) as favorites,
+                      TOTAL(content_type = 'image') as images
+               FROM clips GROUP BY category"""
         ).fetchall()
         return {
-            "total": total, "pinned": pinned, "favorites": favorites,
-            "images": images,
-            "categories": {row["category"]: row["c"] for row in categories},
+            "total": sum(row["c"] for row in rows),
+            "pinned": int(sum(row["pinned"] for row in rows)),
+            "favorites": int(sum(row["favorites"] for row in rows)),
+            "images": int(sum(row["images"] for row in rows)),
+            "categories": {row["category"]: row["c"] for row in rows},
         }
 
     # --- Export / Import ---
 
-    def export_to_json(self, filepath: str):
-        """Export clips/settings/collections to JSON with embedded image bytes."""
-        collections = [dict(row) for row in self.get_collections()]
+    def _export_data(self, clip_hook, conn: Optional[sqlite3.Connection] = None) -> dict:
+        """Collect clips/settings/collections; clip_hook(clip) attaches images.
+
+        conn defaults to this database; backup snapshots are read the same way.
+        """
+        if conn is None:
+            conn = self._reader()
+        collections = [
+            dict(row) for row in conn.execute("SELECT * FROM collections ORDER BY name")
+        ]
         collection_names = {row["id"]: row["name"] for row in collections}
-        clips = self.conn.execute(
-            """SELECT id, content_type, category, content_subtype, text_content,
+        clips = conn.execute(
+            f"""SELECT id, content_type, category, content_subtype, text_content,
                       image_path, thumb_path, image_width, image_height, preview, metadata_json,
                       pinned, favorite, is_snippet, is_sensitive, created_at, used_at, use_count,
-                      content_hash, collection_id
+                      {HASH_HEX_SQL}, collection_id
                FROM clips ORDER BY created_at"""
         ).fetchall()
 
@@ -492,29 +700,94 @@ class Database:
         for row in clips:
             clip = dict(row)
             clip["collection_name"] = collection_names.get(clip.get("collection_id"))
-
-            image_path = clip.get("image_path")
-            thumb_path = clip.get("thumb_path")
-            clip["image_data_b64"] = self._read_file_b64(image_path)
-            clip["thumb_data_b64"] = self._read_file_b64(thumb_path)
+            clip_hook(clip)
             serialized_clips.append(clip)
 
-        data = {
+        return {
             "version": 2,
             "exported_at": time.time(),
             "clips": serialized_clips,
             "collections": collections,
-            "settings": self.get_all_settings(),
+            "settings": {
+                row["key"]: row["value"]
+                for row in conn.execute("SELECT key, value FROM settings")
+            },
         }
 
+    def export_to_json(self, filepath: str):
+        """Export clips/settings/collections to JSON with embedded image bytes."""
+
+        def embed_images(clip: dict):
+            clip["image_data_b64"] = self._read_file_b64(clip.get("image_path"))
+            clip["thumb_data_b64"] = self._read_file_b64(clip.get("thumb_path"))
+
+        data = self._export_data(embed_images)
         with open(filepath, "w", encoding="utf-8") as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
 
+    def export_to_zip(self, filepath: str):
+        """Export to a ZIP archive: JSON manifest plus raw image files.
+
+        Images are copied into the archive by path, so they are never
+        base64-encoded or held in memory as a whole.
+        """
+        with zipfile.ZipFile(filepath, "w", zipfile.ZIP_DEFLATED) as zf:
+
+            def store_images(clip: dict):
+                for path_field, folder, file_field in (
+                    ("image_path", "images", "image_file"),
+                    ("thumb_path", "thumbs", "thumb_file"),
+                ):
+                    path = clip.get(path_field)
+                    if not path or not os.path.isfile(path):
+                        continue
+                    ext = os.path.splitext(path)[1] or ".png"
+                    arcname = f"{folder}/{clip['id']}{ext}"
+                    # Images are already compressed, deflating them again only costs CPU
+                    zf.write(path, arcname=arcname, compress_type=zipfile.ZIP_STORED)
+                    clip[file_field] = arcname
+
+            data = self._export_data(store_images)
+            zf.writestr(EXPORT_MANIFEST, json.dumps(data, ensure_ascii=False, indent=2))
+
     def import_from_json(self, filepath: str) -> int:
-        """Import clips from JSON. Returns number of imported clips."""
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        """Import clips from a JSON/ZIP export or a backup snapshot.
 
+        Returns number of imported clips.
+        """
+        archive = zipfile.ZipFile(filepath) if zipfile.is_zipfile(filepath) else None
+        try:
+            if archive is not None:
+                data = json.loads(archive.read(EXPORT_MANIFEST).decode("utf-8"))
+            elif self._is_sqlite_file(filepath):
+                data = self._read_backup(filepath)
+            else:
+                with open(filepath, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+
+            count = self._import_data(data, archive)
+        finally:
+            if archive is not None:
+                archive.close()
+
+        self._auto_cleanup(self._max_history_limit())
+        return count
+
+    @_write_op
+    def _import_data(self, data: dict, archive: Optional[zipfile.ZipFile] = None) -> int:
+        """Insert parsed export data as one unit: all of it or nothing."""
+        # A savepoint, since earlier writes of the batch may share the transaction
+        self.conn.execute("SAVEPOINT import_data")
+        try:
+            count = self._insert_import_data(data, archive)
+        except Exception:
+            self.conn.execute("ROLLBACK TO import_data")
+            raise
+        finally:
+            self.conn.execute("RELEASE import_data")
+        return count
+
+    def _insert_import_data(self, data: dict, archive: Optional[zipfile.ZipFile]) -> int:
         settings_data = data.get("settings")
         if isinstance(settings_data, dict):
             for key, value in settings_data.items():
@@ -544,11 +817,18 @@ class Database:
             if row:
                 collection_name_to_id[name] = row["id"]
 
-        self.conn.commit()
-
-        count = 0
+        # All known hashes in one query instead of one index probe per clip
+        known_hashes = {
+            row[0]
+            for row in self.conn.execute(
+                "SELECT content_hash FROM clips WHERE content_hash IS NOT NULL"
+            )
+        }
+        rows = []
         for clip in data.get("clips", []):
             image_bytes = self._decode_b64(clip.get("image_data_b64"))
+            if image_bytes is None:
+                image_bytes = self._read_archive_member(archive, clip.get("image_file"))
             if image_bytes is None:
                 src_image = clip.get("image_path")
                 if src_image and os.path.exists(src_image):
@@ -570,12 +850,10 @@ class Database:
                 else:
                     continue
 
-            existing = self.conn.execute(
-                "SELECT id FROM clips WHERE content_hash = ?",
-                (content_hash,),
-            ).fetchone()
-            if existing:
+            hash_key = self._hash_key(content_hash)
+            if hash_key in known_hashes:
                 continue
+            known_hashes.add(hash_key)
 
             metadata = {}
             raw_metadata = clip.get("metadata_json")
@@ -596,6 +874,8 @@ class Database:
                     content_hash,
                 )
                 thumb_bytes = self._decode_b64(clip.get("thumb_data_b64"))
+                if thumb_bytes is None:
+                    thumb_bytes = self._read_archive_member(archive, clip.get("thumb_file"))
                 if thumb_bytes and thumb_path:
                     try:
                         with open(thumb_path, "wb") as f:
@@ -603,23 +883,6 @@ class Database:
                     except OSError:
                         pass
 
-            clip_id = self.add_clip(
-                content_type=clip.get("content_type", "text"),
-                content_hash=content_hash,
-                preview=clip.get("preview") or "",
-                category=clip.get("category", "text"),
-                content_subtype=clip.get("content_subtype"),
-                text_content=text_content,
-                image_path=image_path,
-                image_width=clip.get("image_width"),
-                image_height=clip.get("image_height"),
-                thumb_path=thumb_path,
-                metadata=metadata or None,
-                is_sensitive=self._to_bool(clip.get("is_sensitive", 0)),
-            )
-            if clip_id is None:
-                continue
-
             collection_id = None
             collection_name = clip.get("collection_name")
             if collection_name in collection_name_to_id:
@@ -641,77 +904,141 @@ class Database:
             is_snippet = 1 if self._to_bool(clip.get("is_snippet", 0)) else 0
             is_sensitive = 1 if self._to_bool(clip.get("is_sensitive", 0)) else 0
 
-            self.conn.execute(
-                """
-                UPDATE clips
-                SET pinned = ?, favorite = ?, is_snippet = ?, is_sensitive = ?,
-                    use_count = ?, created_at = ?, used_at = ?, collection_id = ?
-                WHERE id = ?
-                """,
-                (
-                    pinned,
-                    favorite,
-                    is_snippet,
-                    is_sensitive,
-                    use_count,
-                    created_at,
-                    used_at,
-                    collection_id,
-                    clip_id,
-                ),
-            )
-            count += 1
-
-        self.conn.commit()
-        self._auto_cleanup(self._max_history_limit())
-        return count
+            rows.append((
+                clip.get("content_type", "text"),
+                clip.get("category", "text"),
+                clip.get("content_subtype"),
+                text_content,
+                image_path,
+                thumb_path,
+                clip.get("preview") or "",
+                json.dumps(metadata) if metadata else None,
+                hash_key,
+                clip.get("image_width"),
+                clip.get("image_height"),
+                is_sensitive,
+                pinned,
+                favorite,
+                is_snippet,
+                use_count,
+                used_at,
+                created_at,
+                collection_id,
+            ))
+
+        # One prepared INSERT for all rows; duplicate hashes inside the
+        # file are ignored like clips that already exist
+        if not rows:
+            return 0
+        return self.conn.executemany(IMPORT_CLIP_SQL, rows).rowcount
 
     def create_backup(self, backup_dir: Optional[str] = None, keep_files: int = 30) -> str:
-        """Create a timestamped JSON backup and prune old backup files."""
+        """Snapshot the database with SQLite's online backup API and prune old backups.
+
+        Image files are hard-linked next to the snapshot (copied if the
+        backup folder is on another filesystem).
+        """
         target_dir = os.path.expanduser(backup_dir or self.backups_dir)
         os.makedirs(target_dir, exist_ok=True)
 
         timestamp = time.strftime("%Y%m%d_%H%M%S")
         millis = int((time.time() % 1) * 1000)
         backup_path = os.path.join(
-            target_dir, f"clipkeeper_backup_{timestamp}_{millis:03d}.json"
+            target_dir, f"{BACKUP_PREFIX}{timestamp}_{millis:03d}.db"
         )
         if os.path.exists(backup_path):
             backup_path = os.path.join(
-                target_dir, f"clipkeeper_backup_{timestamp}_{millis:03d}_{os.getpid()}.json"
+                target_dir, f"{BACKUP_PREFIX}{timestamp}_{millis:03d}_{os.getpid()}.db"
             )
-        self.export_to_json(backup_path)
+
+        snapshot = sqlite3.connect(backup_path)
+        try:
+            # One read transaction on this thread's reader: a consistent copy
+            # that never blocks the writer under WAL
+            self._reader().backup(snapshot)
+        finally:
+            snapshot.close()
+
+        self._link_backup_images(backup_path)
         self._cleanup_backups(target_dir, keep_files)
         return backup_path
 
+    def _link_backup_images(self, backup_path: str):
+        images_dir = os.path.splitext(backup_path)[0] + BACKUP_IMAGES_SUFFIX
+        rows = self._reader().execute(
+            "SELECT image_path, thumb_path FROM clips WHERE image_path IS NOT NULL"
+        ).fetchall()
+        for row in rows:
+            for path in (row["image_path"], row["thumb_path"]):
+                if not path or not os.path.isfile(path):
+                    continue
+                os.makedirs(images_dir, exist_ok=True)
+                target = os.path.join(images_dir, os.path.basename(path))
+                try:
+                    os.link(path, target)
+                except FileExistsError:
+                    pass
+                except OSError:
+                    shutil.copy2(path, target)
+
+    def _read_backup(self, filepath: str) -> dict:
+        """Read a backup snapshot into the same structure as a JSON export."""
+        images_dir = os.path.splitext(filepath)[0] + BACKUP_IMAGES_SUFFIX
+
+        def use_linked_images(clip: dict):
+            for path_field in ("image_path", "thumb_path"):
+                path = clip.get(path_field)
+                if not path:
+                    continue
+                linked = os.path.join(images_dir, os.path.basename(path))
+                if os.path.isfile(linked):
+                    clip[path_field] = linked
+
+        uri = "file:" + urllib.parse.quote(os.path.abspath(filepath)) + "?mode=ro"
+        snapshot = sqlite3.connect(uri, uri=True)
+        snapshot.row_factory = sqlite3.Row
+        try:
+            return self._export_data(use_linked_images, conn=snapshot)
+        finally:
+            snapshot.close()
+
+    @staticmethod
+    def _is_sqlite_file(filepath: str) -> bool:
+        try:
+            with open(filepath, "rb") as f:
+                return f.read(len(SQLITE_HEADER)) == SQLITE_HEADER
+        except OSError:
+            return False
+
     # --- Cleanup ---
 
+    @_write_op
     def _auto_cleanup(self, max_items: int = 500):
         count = self.conn.execute(
             "SELECT COUNT(*) as c FROM clips WHERE pinned = 0 AND favorite = 0"
         ).fetchone()["c"]
         if count > max_items:
-            clips_to_delete = self.conn.execute(
-                """SELECT id, image_path, thumb_path FROM clips
-                   WHERE pinned = 0 AND favorite = 0
-                   ORDER BY used_at ASC LIMIT ?""",
-                (count - max_items,),
-            ).fetchall()
-            for clip in clips_to_delete:
-                for path_field in ("image_path", "thumb_path"):
-                    path = clip[path_field]
-                    if path and os.path.exists(path):
-                        try:
-                            os.remove(path)
-                        except OSError:
-                            pass
-            self.conn.execute(
+            # One ordered DELETE; RETURNING hands back the files to remove
+            removed = self.conn.execute(
                 """DELETE FROM clips WHERE id IN (
                        SELECT id FROM clips WHERE pinned = 0 AND favorite = 0
-                       ORDER BY used_at ASC LIMIT ?)""",
+                       ORDER BY used_at ASC LIMIT ?)
+                   RETURNING image_path, thumb_path""",
                 (count - max_items,),
-            )
-            self.conn.commit()
+            ).fetchall()
+            self._remove_clip_files(removed)
+        self._maybe_optimize()
+
+    def _maybe_optimize(self):
+        """Run PRAGMA optimize if the last run is older than OPTIMIZE_INTERVAL."""
+        now = time.monotonic()
+        if now - self._last_optimize < OPTIMIZE_INTERVAL:
+            return
+        self._last_optimize = now
+        try:
+            self.conn.execute("PRAGMA optimize")
+        except sqlite3.Error as e:
+            print(f"[Database] PRAGMA optimize failed: {e}")
 
     def _cleanup_backups(self, backup_dir: str, keep_files: int):
         try:
@@ -722,7 +1049,7 @@ class Database:
         entries = []
         try:
             for name in os.listdir(backup_dir):
-                if not name.startswith("clipkeeper_backup_") or not name.endswith(".json"):
+                if not name.startswith(BACKUP_PREFIX) or not name.endswith((".json", ".db")):
                     continue
                 path = os.path.join(backup_dir, name)
                 if os.path.isfile(path):
@@ -732,13 +1059,127 @@ class Database:
 
         entries.sort(reverse=True)
         for _, path in entries[keep:]:
+            self._remove_quiet(path)
+            images_dir = os.path.splitext(path)[0] + BACKUP_IMAGES_SUFFIX
+            if os.path.isdir(images_dir):
+                shutil.rmtree(images_dir, ignore_errors=True)
+
+    @staticmethod
+    def _remove_quiet(path: Optional[str]):
+        """Unlink a file, ignoring missing paths (no exists() pre-check)."""
+        if not path:
+            return
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+    def _remove_clip_files(self, clips):
+        """Remove image/thumbnail files of the given clip rows."""
+        paths = [
+            clip[path_field]
+            for clip in clips
+            for path_field in ("image_path", "thumb_path")
+            if clip[path_field]
+        ]
+        if len(paths) < UNLINK_PARALLEL_MIN:
+            for path in paths:
+                self._remove_quiet(path)
+            return
+        # Overlap unlink latency on slow (e.g. network) filesystems
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            pool.map(self._remove_quiet, paths)
+
+    def _reader(self) -> sqlite3.Connection:
+        """Read-only connection of the calling thread (the writer reads its own)."""
+        if threading.current_thread() is self._writer_thread:
+            return self.conn
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self._ro_uri,
+                uri=True,
+                check_same_thread=False,
+                cached_statements=SQL_CACHE_SIZE,
+            )
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+            conn.execute("PRAGMA busy_timeout=5000")
+            self._local.conn = conn
+        return conn
+
+    def _write(self, fn):
+        """Run fn() on the writer thread; returns its result once committed."""
+        if threading.current_thread() is self._writer_thread:
+            return fn()
+        future: Future = Future()
+        with self._close_lock:
+            if self._closed:
+                raise sqlite3.ProgrammingError("Cannot operate on a closed database.")
+            self._wq.put((fn, future))
+        return future.result()
+
+    def _writer_loop(self):
+        """Execute queued writes, committing each batch in one transaction."""
+        while True:
+            op = self._wq.get()
+            if op is None:
+                return
+            done = []
+            deadline = time.monotonic() + WRITE_BATCH_WINDOW
+            if not self.conn.in_transaction:
+                self.conn.execute("BEGIN")
+            while op is not None:
+                fn, future = op
+                # Each op in its own savepoint: a failing op leaves no partial
+                # writes in the batch's commit
+                self.conn.execute("SAVEPOINT write_op")
+                try:
+                    result = fn()
+                except Exception as e:
+                    self.conn.execute("ROLLBACK TO write_op")
+                    done.append((future, None, e))
+                else:
+                    done.append((future, result, None))
+                finally:
+                    self.conn.execute("RELEASE write_op")
+                if len(done) >= WRITE_BATCH_SIZE or time.monotonic() >= deadline:
+                    break
+                try:
+                    op = self._wq.get_nowait()
+                except queue.Empty:
+                    break
             try:
-                os.remove(path)
-            except OSError:
-                pass
+                self.conn.commit()
+            except sqlite3.Error as e:
+                print(f"[Database] Commit failed: {e}")
+                self.conn.rollback()
+                done = [(future, None, e) for future, _, _ in done]
+            for future, result, error in done:
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(result)
+            if op is None:
+                return
 
     def close(self):
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._wq.put(None)
+        self._writer_thread.join()
+        try:
+            self.conn.execute("PRAGMA optimize")
+        except sqlite3.Error:
+            pass
         self.conn.close()
+        reader = getattr(self._local, "conn", None)
+        if reader is not None:
+            reader.close()
+            self._local.conn = None
 
     def _max_history_limit(self) -> int:
         try:
@@ -759,6 +1200,8 @@ class Database:
 
     @staticmethod
     def _to_int(value, default: Optional[int] = None) -> Optional[int]:
+        if type(value) is int:  # already parsed by json; bool still goes through int()
+            return value
         try:
             return int(value)
         except (TypeError, ValueError):
@@ -766,18 +1209,47 @@ class Database:
 
     @staticmethod
     def _to_float(value, default: float) -> float:
+        if type(value) is float:
+            return value
         try:
             return float(value)
         except (TypeError, ValueError):
             return default
 
+    @staticmethod
+    def _hash_key(content_hash):
+        """Stored form of a hex content hash (raw bytes); other values as-is."""
+        if isinstance(content_hash, str):
+            try:
+                return bytes.fromhex(content_hash)
+            except ValueError:
+                pass
+        return content_hash
+
+    @staticmethod
+    def _read_archive_member(archive: Optional[zipfile.ZipFile], name) -> Optional[bytes]:
+        if archive is None or not isinstance(name, str) or not name:
+            return None
+        try:
+            return archive.read(name)
+        except (KeyError, OSError, zipfile.BadZipFile):
+            return None
+
     @staticmethod
     def _read_file_b64(path: Optional[str]) -> Optional[str]:
-        if not path or not os.path.exists(path):
+        if not path:
             return None
         try:
             with open(path, "rb") as f:
-                return base64.b64encode(f.read()).decode("ascii")
+                if os.fstat(f.fileno()).st_size == 0:
+                    return ""  # mmap refuses empty files
+                # Encode straight from the page cache, no intermediate bytes copy
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    with memoryview(mm) as view:
+                        if HAS_PYBASE64 and len(view) >= B64_SIMD_MIN:
+                            # Encodes straight into a str, no intermediate bytes
+                            return pybase64.b64encode_as_string(view)
+                        return base64.b64encode(view).decode("ascii")
         except OSError:
             return None
 
@@ -786,6 +1258,7 @@ class Database:
         if not value:
             return None
         try:
-            return base64.b64decode(value)
+            codec = pybase64 if HAS_PYBASE64 and len(value) >= B64_SIMD_MIN else base64
+            return codec.b64decode(value)
         except (binascii.Error, ValueError, TypeError):
             return None
@@ -4,54 +4,88 @@ from gi.repository import Gtk, Gdk
 
 from .i18n import tr
 
+# Widget tree of the dialog: GTK parses this once per process and builds each
+# new dialog from it in C. Labels are filled in __init__ (they are translated).
+EDIT_DIALOG_UI = """
+<interface>
+  <template class="ClipKeeperEditDialog" parent="GtkWindow">
+    <property name="modal">True</property>
+    <property name="default-width">500</property>
+    <property name="default-height">400</property>
+    <child>
+      <object class="GtkBox">
+        <property name="orientation">vertical</property>
+        <property name="spacing">12</property>
+        <property name="margin-top">12</property>
+        <property name="margin-bottom">12</property>
+        <property name="margin-start">12</property>
+        <property name="margin-end">12</property>
+        <child>
+          <object class="GtkScrolledWindow">
+            <property name="vexpand">True</property>
+            <child>
+              <object class="GtkTextView" id="text_view">
+                <property name="wrap-mode">word</property>
+              </object>
+            </child>
+          </object>
+        </child>
+        <child>
+          <object class="GtkBox">
+            <property name="orientation">horizontal</property>
+            <property name="spacing">12</property>
+            <property name="halign">end</property>
+            <child>
+              <object class="GtkButton" id="cancel_btn">
+                <signal name="clicked" handler="_on_cancel_clicked"/>
+              </object>
+            </child>
+            <child>
+              <object class="GtkButton" id="save_btn">
+                <style>
+                  <class name="suggested-action"/>
+                </style>
+                <signal name="clicked" handler="_on_save_clicked"/>
+              </object>
+            </child>
+          </object>
+        </child>
+      </object>
+    </child>
+  </template>
+</interface>
+"""
+
+
+@Gtk.Template(string=EDIT_DIALOG_UI)
 class EditDialog(Gtk.Window):
     """Dialog for editing clip text."""
 
+    __gtype_name__ = "ClipKeeperEditDialog"
+
+    text_view = Gtk.Template.Child()
+    cancel_btn = Gtk.Template.Child()
+    save_btn = Gtk.Template.Child()
+
     def __init__(self, parent, text, on_save):
         super().__init__(transient_for=parent)
-        self.set_modal(True)
         self.set_title(tr("edit.title"))
-        self.set_default_size(500, 400)
         self.on_save = on_save
 
-        # Main layout
-        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
-        box.set_margin_top(12)
-        box.set_margin_bottom(12)
-        box.set_margin_start(12)
-        box.set_margin_end(12)
-        self.set_child(box)
-
-        # Text View
-        scrolled = Gtk.ScrolledWindow()
-        scrolled.set_vexpand(True)
-        
-        self.text_view = Gtk.TextView()
-        self.text_view.set_wrap_mode(Gtk.WrapMode.WORD)
+        self.cancel_btn.set_label(tr("common.cancel"))
+        self.save_btn.set_label(tr("common.save"))
         self.text_view.get_buffer().set_text(text)
-        scrolled.set_child(self.text_view)
-        box.append(scrolled)
-
-        # Buttons
-        btn_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-        btn_box.set_halign(Gtk.Align.END)
-        
-        cancel_btn = Gtk.Button(label=tr("common.cancel"))
-        cancel_btn.connect("clicked", lambda _: self.close())
-        btn_box.append(cancel_btn)
-        
-        save_btn = Gtk.Button(label=tr("common.save"))
-        save_btn.add_css_class("suggested-action")
-        save_btn.connect("clicked", self._on_save_clicked)
-        btn_box.append(save_btn)
-        
-        box.append(btn_box)
 
+    @Gtk.Template.Callback()
+    def _on_cancel_clicked(self, btn):
+        self.close()
+
+    @Gtk.Template.Callback()
     def _on_save_clicked(self, btn):
         buffer = self.text_view.get_buffer()
         start, end = buffer.get_bounds()
         new_text = buffer.get_text(start, end, True).strip()
-        
+
         if self.on_save:
             self.on_save(new_text)
         self.close()
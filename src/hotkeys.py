@@ -3,34 +3,80 @@
 from __future__ import annotations
 
 import ast
+import mmap
 import os
 import re
 import shlex
 import shutil
 import subprocess
+from functools import lru_cache
 from typing import Optional
 
+# Gio talks to dconf in-process; the gsettings CLI is the fallback
+try:
+    from gi.repository import Gio
+    HAS_GIO = True
+except ImportError:
+    HAS_GIO = False
+
 
 GNOME_SCHEMA = "org.gnome.settings-daemon.plugins.media-keys"
 GNOME_KEY = "custom-keybindings"
+GNOME_CUSTOM_SCHEMA = "org.gnome.settings-daemon.plugins.media-keys.custom-keybinding"
 GNOME_BASE_PATH = "/org/gnome/settings-daemon/plugins/media-keys/custom-keybindings/"
 GNOME_LEGACY_PATH = f"{GNOME_BASE_PATH}clipkeeper/"
 GNOME_CUSTOM_PATH_RE = re.compile(rf"^{re.escape(GNOME_BASE_PATH)}custom(\d+)/$")
 
+HOTKEY_SPLIT_RE = re.compile(r"\s*\+\s*")
+MODIFIER_RE = re.compile(r"<([^>]+)>")
+MODIFIER_TAG_RE = re.compile(r"<[^>]+>")
+QUOTED_STRING_RE = re.compile(r"'([^']*)'")
+
+# User-typed modifier names -> GTK accelerator modifiers, and back for display
+MODIFIER_MAP = {
+    "super": "Super",
+    "win": "Super",
+    "meta": "Meta",
+    "ctrl": "Control",
+    "control": "Control",
+    "alt": "Alt",
+    "shift": "Shift",
+}
+# Common spellings (ctrl, CTRL, Ctrl) resolve without lowering the token
+MODIFIER_MAP.update({
+    variant(name): value
+    for name, value in MODIFIER_MAP.items()
+    for variant in (str.upper, str.capitalize)
+})
+DISPLAY_MODIFIER_MAP = {
+    "Super": "Super",
+    "Meta": "Meta",
+    "Control": "Ctrl",
+    "Alt": "Alt",
+    "Shift": "Shift",
+}
+
 HYPR_DIR = os.path.expanduser("~/.config/hypr")
 HYPR_MAIN_CONF = os.path.join(HYPR_DIR, "hyprland.conf")
 HYPR_CLIP_CONF = os.path.join(HYPR_DIR, "clipkeeper.conf")
 HYPR_SOURCE_MARKER = "clipkeeper.conf"
 
 
+# Session type, gsettings availability and install path are fixed for the
+# life of the process, so the probes below run once
+@lru_cache(maxsize=1)
 def has_gnome_hotkey_support() -> bool:
+    if _gio_has_schemas():
+        return True
     if shutil.which("gsettings") is None:
         return False
-    result = _run(["gsettings", "list-keys", GNOME_SCHEMA], timeout=5)
+    result = _run(["gsettings", "list-keys", GNOME_SCHEMA], timeout=5, capture=False)
     return result.returncode == 0
 
 
+@lru_cache(maxsize=1)
 def is_hyprland_session() -> bool:
+    """Environment is read on the first call only; later changes are ignored."""
     if os.environ.get("HYPRLAND_INSTANCE_SIGNATURE"):
         return True
 
@@ -44,6 +90,7 @@ def is_hyprland_session() -> bool:
     return "hypr" in tokens
 
 
+@lru_cache(maxsize=1)
 def default_toggle_command() -> str:
     """Resolve command used by the desktop shortcut."""
     bin_path = os.path.expanduser("~/.local/bin/clipkeeper")
@@ -53,6 +100,15 @@ def default_toggle_command() -> str:
     return f"python3 {shlex.quote(main_path)} --toggle"
 
 
+def _reset_env_caches():
+    """Forget the cached session probes."""
+    has_gnome_hotkey_support.cache_clear()
+    _gio_has_schemas.cache_clear()
+    is_hyprland_session.cache_clear()
+    default_toggle_command.cache_clear()
+
+
+@lru_cache(maxsize=128)
 def normalize_hotkey(value: str) -> str:
     raw = (value or "").strip()
     if not raw:
@@ -65,26 +121,17 @@ def normalize_hotkey(value: str) -> str:
     if raw.startswith("<"):
         return raw
 
-    parts = [p.strip() for p in re.split(r"\s*\+\s*", raw) if p.strip()]
+    parts = [p.strip() for p in HOTKEY_SPLIT_RE.split(raw) if p.strip()]
     if not parts:
         return "disabled"
 
     key = parts[-1]
-    modifier_map = {
-        "super": "Super",
-        "win": "Super",
-        "meta": "Meta",
-        "ctrl": "Control",
-        "control": "Control",
-        "alt": "Alt",
-        "shift": "Shift",
-    }
-
-    modifiers = []
-    for part in parts[:-1]:
-        normalized = modifier_map.get(part.lower())
-        if normalized and normalized not in modifiers:
-            modifiers.append(normalized)
+    # dict.fromkeys drops repeated modifiers and keeps their order
+    modifiers = list(dict.fromkeys(
+        mapped
+        for part in parts[:-1]
+        if (mapped := MODIFIER_MAP.get(part) or MODIFIER_MAP.get(part.lower()))
+    ))
 
     if len(key) == 1:
         key = key.lower()
@@ -94,6 +141,7 @@ def normalize_hotkey(value: str) -> str:
     return "".join(f"<{m}>" for m in modifiers) + key
 
 
+@lru_cache(maxsize=128)
 def display_hotkey(binding: Optional[str]) -> str:
     if not binding:
         return "Disabled"
@@ -102,18 +150,10 @@ def display_hotkey(binding: Optional[str]) -> str:
     if binding.lower() == "disabled":
         return "Disabled"
 
-    modifiers = re.findall(r"<([^>]+)>", binding)
-    key = re.sub(r"<[^>]+>", "", binding)
+    modifiers = MODIFIER_RE.findall(binding)
+    key = MODIFIER_TAG_RE.sub("", binding)
 
-    reverse_map = {
-        "Super": "Super",
-        "Meta": "Meta",
-        "Control": "Ctrl",
-        "Alt": "Alt",
-        "Shift": "Shift",
-    }
-
-    parts = [reverse_map.get(m, m) for m in modifiers]
+    parts = [DISPLAY_MODIFIER_MAP.get(m, m) for m in modifiers]
     if key:
         if len(key) == 1:
             parts.append(key.upper())
@@ -139,6 +179,9 @@ def apply_system_hotkey(
     command: Optional[str] = None,
     name: str = "ClipKeeper",
 ) -> tuple[bool, str]:
+    # Probe the session afresh: schemas or the launcher may have been
+    # installed since the last registration
+    _reset_env_caches()
     if is_hyprland_session():
         ok, res = apply_hyprland_hotkey(hotkey, command=command)
         if ok:
@@ -161,8 +204,8 @@ def get_gnome_hotkey() -> Optional[str]:
 
     bindings = _get_custom_keybindings()
     paths = _find_gnome_clipkeeper_paths(bindings)
-    for path in paths:
-        value = _gnome_get_string(path, "binding")
+    for keys in paths.values():
+        value = keys.get("binding")
         if value:
             return value
     return None
@@ -197,26 +240,33 @@ def apply_gnome_hotkey(
     if target_path not in new_bindings:
         new_bindings.append(target_path)
 
-    ok, err = _set_custom_keybindings(new_bindings)
-    if not ok:
-        return False, err
-
     cmd = command or default_toggle_command()
+    settings = _gio_settings(target_path)
+    if settings is not None:
+        ok, err = _set_custom_keybindings(new_bindings)
+        if not ok:
+            return False, err
+        for key, value in (("name", name), ("command", cmd), ("binding", normalized)):
+            if not settings.set_string(key, value):
+                return False, "Failed to set GNOME hotkey"
+        Gio.Settings.sync()
+        return True, normalized
+
+    # Without Gio: every write plus the read-back in one shell, one fork from here
     schema = _gnome_schema_for_path(target_path)
-
     steps = [
+        ["gsettings", "set", GNOME_SCHEMA, GNOME_KEY, str(new_bindings)],
         ["gsettings", "set", schema, "name", name],
         ["gsettings", "set", schema, "command", cmd],
         ["gsettings", "set", schema, "binding", normalized],
+        ["gsettings", "get", schema, "binding"],
     ]
+    result = _run(["sh", "-c", " && ".join(shlex.join(step) for step in steps)], timeout=15)
+    if result.returncode != 0:
+        stderr = result.stderr.strip() or result.stdout.strip()
+        return False, stderr or "Failed to set GNOME hotkey"
 
-    for step in steps:
-        result = _run(step, timeout=5)
-        if result.returncode != 0:
-            stderr = result.stderr.strip() or result.stdout.strip()
-            return False, stderr or "Failed to set GNOME hotkey"
-
-    read_back = _gnome_get_string(target_path, "binding")
+    read_back = _strip_gvariant_string(result.stdout.strip())
     if read_back and read_back != normalized:
         return False, f"Binding mismatch after write: {read_back}"
 
@@ -237,28 +287,52 @@ def remove_gnome_hotkey() -> tuple[bool, str]:
 
 
 def _gnome_schema_for_path(path: str) -> str:
+    return f"{GNOME_CUSTOM_SCHEMA}:{path}"
+
+
+@lru_cache(maxsize=1)
+def _gio_has_schemas() -> bool:
+    """Whether both media-keys schemas are installed (Gio aborts on unknown ones)."""
+    if not HAS_GIO:
+        return False
+    source = Gio.SettingsSchemaSource.get_default()
     return (
-        "org.gnome.settings-daemon.plugins.media-keys.custom-keybinding:"
-        f"{path}"
+        source is not None
+        and source.lookup(GNOME_SCHEMA, True) is not None
+        and source.lookup(GNOME_CUSTOM_SCHEMA, True) is not None
     )
 
 
-def _find_gnome_clipkeeper_paths(bindings: list[str]) -> list[str]:
-    result: list[str] = []
+def _gio_settings(path: Optional[str] = None):
+    """Gio.Settings for the media-keys schema or a custom keybinding path.
+
+    None when Gio or the schemas are unavailable.
+    """
+    if not _gio_has_schemas():
+        return None
+    if path is None:
+        return Gio.Settings.new(GNOME_SCHEMA)
+    return Gio.Settings.new_with_path(GNOME_CUSTOM_SCHEMA, path)
+
+
+def _find_gnome_clipkeeper_paths(bindings: list[str]) -> dict[str, dict[str, str]]:
+    """ClipKeeper's custom keybinding paths, mapped to their keys."""
+    result: dict[str, dict[str, str]] = {}
     for path in bindings:
+        keys = _gnome_get_keys(path)
         if path == GNOME_LEGACY_PATH:
-            result.append(path)
+            result[path] = keys
             continue
 
-        name = (_gnome_get_string(path, "name") or "").lower()
-        command = (_gnome_get_string(path, "command") or "").lower()
+        name = keys.get("name", "").lower()
+        command = keys.get("command", "").lower()
 
         if (
             "clipkeeper" in name
             or "clipkeeper" in command
             or command.endswith("main.py --toggle")
         ):
-            result.append(path)
+            result[path] = keys
 
     return result
 
@@ -276,7 +350,31 @@ def _allocate_gnome_custom_path(bindings: list[str]) -> str:
     return f"{GNOME_BASE_PATH}custom{idx}/"
 
 
+def _gnome_get_keys(path: str) -> dict[str, str]:
+    """All keys of a custom keybinding at once (one gsettings call without Gio)."""
+    settings = _gio_settings(path)
+    if settings is not None:
+        return {key: settings.get_string(key) for key in ("name", "command", "binding")}
+
+    schema = _gnome_schema_for_path(path)
+    result = _run(["gsettings", "list-recursively", schema], timeout=5)
+    if result.returncode != 0:
+        values = {key: _gnome_get_string(path, key) for key in ("name", "command", "binding")}
+        return {key: value for key, value in values.items() if value is not None}
+
+    keys = {}
+    # Lines are "<schema> <key> <value>"
+    for line in result.stdout.splitlines():
+        parts = line.split(" ", 2)
+        if len(parts) == 3:
+            keys[parts[1]] = _strip_gvariant_string(parts[2].strip())
+    return keys
+
+
 def _gnome_get_string(path: str, key: str) -> Optional[str]:
+    settings = _gio_settings(path)
+    if settings is not None:
+        return settings.get_string(key)
     schema = _gnome_schema_for_path(path)
     result = _run(["gsettings", "get", schema, key], timeout=5)
     if result.returncode != 0:
@@ -285,6 +383,10 @@ def _gnome_get_string(path: str, key: str) -> Optional[str]:
 
 
 def _get_custom_keybindings() -> list[str]:
+    settings = _gio_settings()
+    if settings is not None:
+        return list(settings.get_strv(GNOME_KEY))
+
     result = _run(["gsettings", "get", GNOME_SCHEMA, GNOME_KEY], timeout=5)
     if result.returncode != 0:
         return []
@@ -293,6 +395,11 @@ def _get_custom_keybindings() -> list[str]:
     if text.startswith("@as "):
         text = text[4:]
 
+    # Plain single-quoted paths need no Python parser; escapes or double
+    # quotes go through literal_eval
+    if text.startswith("[") and text.endswith("]") and "\\" not in text and '"' not in text:
+        return QUOTED_STRING_RE.findall(text)
+
     try:
         parsed = ast.literal_eval(text)
     except (SyntaxError, ValueError):
@@ -304,6 +411,13 @@ def _get_custom_keybindings() -> list[str]:
 
 
 def _set_custom_keybindings(bindings: list[str]) -> tuple[bool, str]:
+    settings = _gio_settings()
+    if settings is not None:
+        if not settings.set_strv(GNOME_KEY, bindings):
+            return False, "Failed to update custom keybindings"
+        Gio.Settings.sync()
+        return True, "ok"
+
     value = str(bindings)
     result = _run(["gsettings", "set", GNOME_SCHEMA, GNOME_KEY, value], timeout=5)
     if result.returncode != 0:
@@ -315,13 +429,13 @@ def _set_custom_keybindings(bindings: list[str]) -> tuple[bool, str]:
 # --- Hyprland backend ---
 
 def get_hyprland_hotkey() -> Optional[str]:
-    if not os.path.exists(HYPR_CLIP_CONF):
-        return None
-
     try:
-        with open(HYPR_CLIP_CONF, "r", encoding="utf-8") as f:
+        with open(HYPR_CLIP_CONF, "rb") as f:
             for line in f:
-                stripped = line.strip()
+                # Cheap byte scan first; only candidate lines are decoded
+                if b"bind =" not in line:
+                    continue
+                stripped = line.strip().decode("utf-8", "replace")
                 if not stripped.startswith("bind ="):
                     continue
                 # bind = SUPER SHIFT, C, exec, ...
@@ -381,20 +495,23 @@ def apply_hyprland_hotkey(
 def _ensure_hyprland_source_line() -> tuple[bool, str]:
     source_line = "source = ~/.config/hypr/clipkeeper.conf"
 
-    existing = ""
-    if os.path.exists(HYPR_MAIN_CONF):
-        try:
-            with open(HYPR_MAIN_CONF, "r", encoding="utf-8") as f:
-                existing = f.read()
-        except OSError as exc:
-            return False, f"Failed to read {HYPR_MAIN_CONF}: {exc}"
-
-        if HYPR_SOURCE_MARKER in existing:
-            return True, "ok"
+    needs_newline = False
+    try:
+        # Search the raw bytes in place; nothing is decoded or copied
+        with open(HYPR_MAIN_CONF, "rb") as f:
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as conf:
+                    if conf.find(HYPR_SOURCE_MARKER.encode()) != -1:
+                        return True, "ok"
+                    needs_newline = conf[-1:] != b"\n"
+    except FileNotFoundError:
+        pass
+    except OSError as exc:
+        return False, f"Failed to read {HYPR_MAIN_CONF}: {exc}"
 
     try:
         with open(HYPR_MAIN_CONF, "a", encoding="utf-8") as f:
-            if existing and not existing.endswith("\n"):
+            if needs_newline:
                 f.write("\n")
             f.write("\n# ClipKeeper managed hotkey\n")
             f.write(source_line + "\n")
@@ -405,8 +522,8 @@ def _ensure_hyprland_source_line() -> tuple[bool, str]:
 
 
 def _normalized_to_hypr_binding(normalized: str) -> Optional[str]:
-    modifiers = re.findall(r"<([^>]+)>", normalized)
-    key = re.sub(r"<[^>]+>", "", normalized).strip()
+    modifiers = MODIFIER_RE.findall(normalized)
+    key = MODIFIER_TAG_RE.sub("", normalized).strip()
 
     if not key:
         return None
@@ -419,11 +536,9 @@ def _normalized_to_hypr_binding(normalized: str) -> Optional[str]:
         "Shift": "SHIFT",
     }
 
-    hypr_mods = []
-    for modifier in modifiers:
-        mapped = mod_map.get(modifier)
-        if mapped and mapped not in hypr_mods:
-            hypr_mods.append(mapped)
+    hypr_mods = list(dict.fromkeys(
+        mod_map[modifier] for modifier in modifiers if modifier in mod_map
+    ))
 
     key = key.upper()
     mod_part = " ".join(hypr_mods)
@@ -438,14 +553,9 @@ def _hypr_parts_to_normalized(modifiers: str, key: str) -> Optional[str]:
         "SHIFT": "Shift",
     }
 
-    parts = []
-    for token in modifiers.split():
-        token = token.strip().upper()
-        if not token:
-            continue
-        mapped = mod_map.get(token)
-        if mapped and mapped not in parts:
-            parts.append(mapped)
+    parts = list(dict.fromkeys(
+        mod_map[token] for token in modifiers.upper().split() if token in mod_map
+    ))
 
     key = key.strip()
     if not key:
@@ -463,8 +573,13 @@ def _strip_gvariant_string(text: str) -> str:
     return text
 
 
-def _run(args: list[str], timeout: int = 2) -> subprocess.CompletedProcess:
+def _run(args: list[str], timeout: int = 2, capture: bool = True) -> subprocess.CompletedProcess:
+    """Run a command; with capture=False output is discarded, not decoded."""
     try:
+        if not capture:
+            return subprocess.run(
+                args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=timeout
+            )
         return subprocess.run(args, capture_output=True, text=True, timeout=timeout)
     except Exception as exc:
         return subprocess.CompletedProcess(args=args, returncode=1, stdout="", stderr=str(exc))
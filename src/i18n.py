@@ -18,30 +18,49 @@ class I18nManager:
     def __init__(self) -> None:
         self._translations: dict[str, dict[str, str]] = {}
         self._locale = DEFAULT_LOCALE
+        # Tables of the active and default locale, so tr() does no locale lookup
+        self._current: dict[str, str] = {}
+        self._fallback: dict[str, str] = {}
+        # The environment does not change while running; detected once
+        self._system_locale: str | None = None
 
     def reload(self) -> None:
+        """Drop parsed locales; they are read again when next needed."""
         self._translations.clear()
-        for code in SUPPORTED_LOCALES:
-            path = os.path.join(LOCALES_DIR, f"{code}.json")
-            try:
-                with open(path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                if isinstance(data, dict):
-                    self._translations[code] = {
-                        str(k): str(v) for k, v in data.items()
-                    }
-                else:
-                    self._translations[code] = {}
-            except (OSError, json.JSONDecodeError):
-                self._translations[code] = {}
+        self._bind_tables()
+
+    def _ensure(self, code: str) -> dict[str, str]:
+        """Parse the locale file of code on first use."""
+        table = self._translations.get(code)
+        if table is not None:
+            return table
+        path = os.path.join(LOCALES_DIR, f"{code}.json")
+        try:
+            # One read and a C-level UTF-8 decode inside json.loads
+            with open(path, "rb") as f:
+                data = json.loads(f.read())
+            if isinstance(data, dict):
+                table = {str(k): str(v) for k, v in data.items()}
+            else:
+                table = {}
+        except (OSError, ValueError):
+            table = {}
+        self._translations[code] = table
+        return table
 
     def set_locale(self, value: str | None) -> str:
         if not value or value == "system":
             value = self.detect_system_locale()
         value = self._normalize_locale(value)
         self._locale = value
+        self._bind_tables()
         return self._locale
 
+    def _bind_tables(self) -> None:
+        # Only the active locale and the fallback are ever loaded
+        self._current = self._ensure(self._locale)
+        self._fallback = self._ensure(DEFAULT_LOCALE)
+
     def get_locale(self) -> str:
         return self._locale
 
@@ -49,6 +68,11 @@ class I18nManager:
         return SUPPORTED_LOCALES
 
     def detect_system_locale(self) -> str:
+        if self._system_locale is None:
+            self._system_locale = self._detect_system_locale()
+        return self._system_locale
+
+    def _detect_system_locale(self) -> str:
         candidates = [
             os.environ.get("LC_ALL"),
             os.environ.get("LC_MESSAGES"),
@@ -67,12 +91,9 @@ class I18nManager:
         return DEFAULT_LOCALE
 
     def tr(self, key: str, **kwargs: Any) -> str:
-        text = (
-            self._translations.get(self._locale, {}).get(key)
-            or self._translations.get(DEFAULT_LOCALE, {}).get(key)
-            or key
-        )
-        if kwargs:
+        text = self._current.get(key) or self._fallback.get(key) or key
+        # Only strings with placeholders are worth a format() parse
+        if kwargs and "{" in text:
             try:
                 return text.format(**kwargs)
             except Exception:
@@ -1,13 +1,30 @@
 import gi
 gi.require_version("Gtk", "4.0")
-gi.require_version("Gdk", "4.0")
-from gi.repository import Gtk, Gdk, GLib, GdkPixbuf
+from gi.repository import Gtk, GLib
 
+import cairo
 from PIL import Image, ImageFilter, ImageDraw
+import math
 import os
+import shutil
+import sys
+import tempfile
+import threading
+
+# Optional: OpenCV's SIMD separable convolution for the blur tool
+try:
+    import cv2
+    import numpy as np
+    HAS_CV2 = True
+except ImportError:
+    cv2 = np = None
+    HAS_CV2 = False
 
 from .i18n import tr
 
+# Largest downscale applied before blurring a selection
+BLUR_REDUCE_FACTOR = 4
+
 class ImageEditor(Gtk.Window):
     """
     Simple Image Editor for Cropping and Blurring.
@@ -31,12 +48,20 @@ class ImageEditor(Gtk.Window):
             self.destroy()
             return
 
-        self.original_image = self.pil_image.copy() # For reset
+        # For reset. Shared with pil_image until an in-place edit (blur)
+        # needs its own copy; crop already returns a new image
+        self.original_image = self.pil_image
+
+        # pil_image resampled to the on-screen size, rebuilt only after the
+        # image or the display size changes
+        self._cached_surface = None
         
         # Selection state
         self.selection_start = None # (x, y)
         self.selection_end = None   # (x, y)
         self.is_dragging = False
+        # Pending coalesced redraw for drag updates
+        self._redraw_source_id = None
         
         self.surface_width = 0
         self.surface_height = 0
@@ -44,6 +69,12 @@ class ImageEditor(Gtk.Window):
         self.offset_x = 0
         self.offset_y = 0
 
+        # A save is running on the worker thread; the window stays open until it ends
+        self._saving = False
+        self._destroyed = False
+        self.connect("close-request", self._on_close_request)
+        self.connect("destroy", self._on_destroy)
+
         self._build_ui()
 
     def _build_ui(self):
@@ -54,13 +85,16 @@ class ImageEditor(Gtk.Window):
         header = Gtk.HeaderBar()
         self.set_titlebar(header)
         
-        cancel_btn = Gtk.Button(label=tr("common.cancel"))
-        cancel_btn.connect("clicked", lambda x: self.destroy())
-        header.pack_start(cancel_btn)
+        self.cancel_btn = Gtk.Button(label=tr("common.cancel"))
+        self.cancel_btn.connect("clicked", lambda x: self.destroy())
+        header.pack_start(self.cancel_btn)
         
-        save_btn = Gtk.Button(label=tr("common.save"), css_classes=["suggested-action"])
-        save_btn.connect("clicked", self._on_save)
-        header.pack_end(save_btn)
+        self.save_btn = Gtk.Button(label=tr("common.save"), css_classes=["suggested-action"])
+        self.save_btn.connect("clicked", self._on_save)
+        header.pack_end(self.save_btn)
+
+        self.save_spinner = Gtk.Spinner()
+        header.pack_end(self.save_spinner)
         
         # Toolbar
         toolbar = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
@@ -97,6 +131,7 @@ class ImageEditor(Gtk.Window):
         
         self.drawing_area = Gtk.DrawingArea()
         self.drawing_area.set_draw_func(self._on_draw)
+        self.drawing_area.connect("resize", self._on_resize)
         
         # Event controller for mouse
         gesture = Gtk.GestureDrag()
@@ -112,24 +147,31 @@ class ImageEditor(Gtk.Window):
 
         self.scrolled.set_child(self.drawing_area)
 
-    def _update_layout(self, width, height):
-        # Calculate scaling to fit image in window (initially)
-        # But here we probably want 1:1 or fit width?
-        # Let's do 'contain' logic for display
+    def _on_resize(self, area, width, height):
+        self._update_layout(width, height)
+
+    def _update_layout(self, width=None, height=None):
+        """Fit the image into the drawing area; runs on resize and image changes.
+
+        Without a size, the drawing area's current size is used.
+        """
+        if width is None:
+            width = self.drawing_area.get_width()
+            height = self.drawing_area.get_height()
         if width <= 0 or height <= 0: return
         
         img_w, img_h = self.pil_image.size
         
+        # Compute exact fit scale
         scale_x = width / img_w
         scale_y = height / img_h
-        self.display_scale = min(scale_x, scale_y, 1.0) # Downscale only, don't upscale
+        self.display_scale = min(scale_x, scale_y) * 0.95 # Leave some margin
         
         # Center image
         self.surface_width = int(img_w * self.display_scale)
         self.surface_height = int(img_h * self.display_scale)
-        
-        self.offset_x = (width - self.surface_width) // 2
-        self.offset_y = (height - self.surface_height) // 2
+        self.offset_x = (width - self.surface_width) / 2
+        self.offset_y = (height - self.surface_height) / 2
         
         self.drawing_area.queue_draw()
 
@@ -141,51 +183,13 @@ class ImageEditor(Gtk.Window):
         if not self.pil_image:
             return
 
-        # 1. Update layout metrics
-        img_w, img_h = self.pil_image.size
-        
-        # Compute exact fit scale
-        scale_x = width / img_w
-        scale_y = height / img_h
-        self.display_scale = min(scale_x, scale_y) * 0.95 # Leave some margin
-        
-        self.surface_width = int(img_w * self.display_scale)
-        self.surface_height = int(img_h * self.display_scale)
-        self.offset_x = (width - self.surface_width) / 2
-        self.offset_y = (height - self.surface_height) / 2
-        
-        # 2. Convert PIL to GdkPixbuf (efficiently?)
-        # For now, converting repeatedly in draw loop is bad, but it works for prototype.
-        # Ensure RGB
-        if self.pil_image.mode != "RGB":
-             data = self.pil_image.convert("RGB").tobytes()
-             n_channels = 3
-             has_alpha = False
-        else:
-             data = self.pil_image.tobytes()
-             n_channels = 3
-             has_alpha = False
-             
-        # Create pixbuf
-        stride = self.pil_image.width * n_channels
-        pixbuf = GdkPixbuf.Pixbuf.new_from_data(
-            data,
-            GdkPixbuf.Colorspace.RGB,
-            has_alpha,
-            8,
-            self.pil_image.width,
-            self.pil_image.height,
-            stride
-        )
-        
-        # 3. Draw Image
-        cr.save()
-        cr.translate(self.offset_x, self.offset_y)
-        cr.scale(self.display_scale, self.display_scale)
-        
-        Gdk.cairo_set_source_pixbuf(cr, pixbuf, 0, 0)
-        cr.paint()
-        cr.restore()
+        # 1. Layout metrics come from _update_layout (resize / image changes)
+
+        # 2. Draw Image: a 1:1 blit of the pre-scaled surface
+        surface = self._get_display_surface()
+        if surface is not None:
+            cr.set_source_surface(surface, round(self.offset_x), round(self.offset_y))
+            cr.paint()
         
         # 4. Draw Selection Rect
         if self.selection_start and self.selection_end:
@@ -198,14 +202,56 @@ class ImageEditor(Gtk.Window):
             rw = abs(x1 - x2)
             rh = abs(y1 - y2)
             
-            cr.set_source_rgba(1, 1, 1, 0.3)
+            # Dim everything outside the selection: one even-odd path of the
+            # widget and the selection, filled in a single pass
+            cr.set_fill_rule(cairo.FILL_RULE_EVEN_ODD)
+            cr.rectangle(0, 0, width, height)
             cr.rectangle(rx, ry, rw, rh)
-            cr.fill_preserve()
-            
+            cr.set_source_rgba(0, 0, 0, 0.45)
+            cr.fill()
+
             cr.set_source_rgba(1, 1, 1, 0.8)
             cr.set_line_width(2)
+            cr.rectangle(rx, ry, rw, rh)
             cr.stroke()
 
+    def _get_display_surface(self):
+        """pil_image at surface_width x surface_height as a Cairo surface."""
+        size = (self.surface_width, self.surface_height)
+        if size[0] < 1 or size[1] < 1:
+            return None
+        surface = self._cached_surface
+        if surface is not None and (surface.get_width(), surface.get_height()) == size:
+            return surface
+
+        image = self.pil_image
+        if image.size != size:
+            # Integer box reduction does the bulk of a large shrink cheaply;
+            # bilinear only covers the fractional rest
+            factor = int(1.0 / self.display_scale) if self.display_scale < 1.0 else 1
+            if factor > 1:
+                image = image.reduce(factor)
+            image = image.resize(size, Image.Resampling.BILINEAR)
+        # FORMAT_RGB24 is one native-endian 32-bit word per pixel (x, r, g, b).
+        # __init__ leaves only RGB or RGBA; on little-endian, RGBA packs as
+        # BGRA with alpha in the ignored x byte, so no convert() copy is made
+        if sys.byteorder == "little":
+            raw_mode = "BGRA" if image.mode == "RGBA" else "BGRX"
+        else:
+            if image.mode != "RGB":
+                image = image.convert("RGB")
+            raw_mode = "XRGB"
+        # Cairo owns the pixel memory; the packed bytes are copied in once
+        # (RGB24 rows are 4-byte pixels, so the stride is exactly width * 4)
+        surface = cairo.ImageSurface(cairo.FORMAT_RGB24, size[0], size[1])
+        surface.get_data()[:] = image.tobytes("raw", raw_mode)
+        surface.mark_dirty()
+        self._cached_surface = surface
+        return surface
+
+    def _invalidate_surface(self):
+        self._cached_surface = None
+
     def _get_selection_rect_image_coords(self):
         """Convert screen selection to image coordinates."""
         if not self.selection_start or not self.selection_end:
@@ -213,11 +259,18 @@ class ImageEditor(Gtk.Window):
             
         x1, y1 = self.selection_start
         x2, y2 = self.selection_end
-        
-        sx1 = (min(x1, x2) - self.offset_x) / self.display_scale
-        sy1 = (min(y1, y2) - self.offset_y) / self.display_scale
-        sx2 = (max(x1, x2) - self.offset_x) / self.display_scale
-        sy2 = (max(y1, y2) - self.offset_y) / self.display_scale
+        if x1 > x2:
+            x1, x2 = x2, x1
+        if y1 > y2:
+            y1, y2 = y2, y1
+        scale = self.display_scale
+        ox = self.offset_x
+        oy = self.offset_y
+        
+        sx1 = (x1 - ox) / scale
+        sy1 = (y1 - oy) / scale
+        sx2 = (x2 - ox) / scale
+        sy2 = (y2 - oy) / scale
         
         # Clamp
         w, h = self.pil_image.size
@@ -238,7 +291,19 @@ class ImageEditor(Gtk.Window):
         if self.is_dragging and self.selection_start:
             start_x, start_y = self.selection_start
             self.selection_end = (start_x + offset_x, start_y + offset_y)
-            self.drawing_area.queue_draw()
+            self._request_redraw()
+
+    def _request_redraw(self):
+        """Queue one redraw for any number of pointer events before the next idle."""
+        if self._redraw_source_id is None:
+            self._redraw_source_id = GLib.idle_add(
+                self._do_redraw, priority=GLib.PRIORITY_DEFAULT
+            )
+
+    def _do_redraw(self):
+        self._redraw_source_id = None
+        self.drawing_area.queue_draw()
+        return False
 
     def _on_drag_end(self, gesture, offset_x, offset_y):
         self.is_dragging = False
@@ -276,6 +341,8 @@ class ImageEditor(Gtk.Window):
         if abs(x2 - x1) < 5 or abs(y2 - y1) < 5: return
         
         self.pil_image = self.pil_image.crop((x1, y1, x2, y2))
+        self._invalidate_surface()
+        self._update_layout()
         
         # Clear selection
         self.selection_start = None
@@ -291,11 +358,12 @@ class ImageEditor(Gtk.Window):
         x1, y1, x2, y2 = coords
         if abs(x2 - x1) < 5 or abs(y2 - y1) < 5: return
         
-        # Crop region, blur it, paste back
-        region = self.pil_image.crop((x1, y1, x2, y2))
-        # Apply heavy gaussian blur
-        blurred = region.filter(ImageFilter.GaussianBlur(radius=15))
+        # Blur the region, paste it back in place
+        if self.pil_image is self.original_image:
+            self.pil_image = self.pil_image.copy()
+        blurred = self._blur_region(self.pil_image, (x1, y1, x2, y2))
         self.pil_image.paste(blurred, (x1, y1))
+        self._invalidate_surface()
         
         # Clear selection
         self.selection_start = None
@@ -304,20 +372,95 @@ class ImageEditor(Gtk.Window):
         self.btn_blur.set_sensitive(False)
         self.drawing_area.queue_draw()
 
+    @staticmethod
+    def _blur_region(image, box, radius=15):
+        """Heavy blur for hiding content.
+
+        The blur runs on a copy shrunk by up to BLUR_REDUCE_FACTOR with the
+        radius scaled to match, then is scaled back: a fraction of the pixel
+        work of blurring at full size, and indistinguishable once smeared.
+        The shrink reads box straight from image, so no full-size crop is made.
+        """
+        size = (box[2] - box[0], box[3] - box[1])
+        factor = max(1, min(BLUR_REDUCE_FACTOR, min(size) // 8))
+        if factor == 1:
+            return ImageEditor._gaussian_blur(image.crop(box), radius)
+        small = image.reduce(factor, box=box)
+        small = ImageEditor._gaussian_blur(small, radius / factor)
+        return small.resize(size, Image.Resampling.BILINEAR)
+
+    @staticmethod
+    def _gaussian_blur(image, radius):
+        """Gaussian blur with standard deviation radius, via OpenCV if installed."""
+        if not HAS_CV2:
+            return image.filter(ImageFilter.GaussianBlur(radius=radius))
+        # One 1-D kernel (3 sigma each side) reused for both passes
+        kernel = cv2.getGaussianKernel(2 * math.ceil(3 * radius) + 1, radius)
+        blurred = cv2.sepFilter2D(
+            np.asarray(image), -1, kernel, kernel, borderType=cv2.BORDER_REPLICATE
+        )
+        return Image.fromarray(blurred)
+
     def _on_reset(self, btn):
-        self.pil_image = self.original_image.copy()
+        self.pil_image = self.original_image
+        self._invalidate_surface()
+        self._update_layout()
         self.selection_start = None
         self.selection_end = None
         self.btn_crop.set_sensitive(False)
         self.btn_blur.set_sensitive(False)
         self.drawing_area.queue_draw()
 
+    def _on_close_request(self, window):
+        # Keep the window (and the save callback target) alive mid-save
+        return self._saving
+
+    def _on_destroy(self, window):
+        self._destroyed = True
+
     def _on_save(self, btn):
-        # Save to file
+        # Encode on a worker thread; a copy, so blur can't touch it mid-save
+        self._saving = True
+        self.save_btn.set_sensitive(False)
+        self.cancel_btn.set_sensitive(False)
+        self.save_spinner.start()
+        image = self.pil_image.copy()
+        threading.Thread(target=self._save_worker, args=(image,), daemon=True).start()
+
+    def _save_worker(self, image):
+        # Write next to the original and swap it in, so an interrupted save
+        # never leaves the clip's file truncated
+        directory, name = os.path.split(self.image_path)
+        _, ext = os.path.splitext(name)
+        fd, tmp_path = tempfile.mkstemp(prefix=f".{name}.", suffix=ext, dir=directory or None)
+        os.close(fd)
         try:
-            self.pil_image.save(self.image_path)
-            if self.on_save_callback:
-                self.on_save_callback()
-            self.close()
+            image.save(tmp_path)
+            try:
+                shutil.copymode(self.image_path, tmp_path)
+            except OSError:
+                pass
+            os.replace(tmp_path, self.image_path)
         except Exception as e:
-            print(f"Error saving image: {e}")
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            GLib.idle_add(self._on_save_done, e)
+            return
+        GLib.idle_add(self._on_save_done, None)
+
+    def _on_save_done(self, error):
+        self._saving = False
+        if self._destroyed:
+            return False
+        self.save_spinner.stop()
+        self.cancel_btn.set_sensitive(True)
+        if error is not None:
+            print(f"Error saving image: {error}")
+            self.save_btn.set_sensitive(True)
+            return False
+        if self.on_save_callback:
+            self.on_save_callback()
+        self.close()
+        return False
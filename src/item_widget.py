@@ -1,43 +1,78 @@
 """
 ClipKeeper — Item Widget.
-Custom ListBoxRow for displaying a clipboard item with type-specific icons,
-quick actions, syntax highlighting, link preview, and drag support.
+List model item and recycled row widget for displaying a clipboard item with
+type-specific icons, quick actions, link preview, and drag support.
 """
 
 import json
-import subprocess
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
 
 import gi
 
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
-from gi.repository import Gdk, GdkPixbuf, GLib, GObject, Gtk
+from gi.repository import Gdk, GLib, GObject, Gtk, Pango
 
+from . import actions
 from .content_detector import ContentDetector
 from .i18n import tr
+from .settings import (
+    ACT_ALL,
+    ACT_DELETE,
+    ACT_EDIT,
+    ACT_FAVORITE,
+    ACT_PIN,
+    ACT_PREVIEW,
+    ACT_QR,
+    ACT_QUICK,
+    ACT_SNIPPET,
+    ACT_TRANSLATE,
+)
 from .utils import (
     format_time_ago,
-    get_category_emoji,
-    load_pixbuf_from_path,
+    get_thumbnail_texture,
 )
 
 
-class ClipItemWidget(Gtk.ListBoxRow):
-    """A row widget representing a single clipboard history entry."""
+# CSS classes of the row action buttons, shared by every row
+_CSS_ACTION = ("flat", "circular", "clip-action-btn")
+_CSS_ACTION_QUICK = _CSS_ACTION + ("quick-action-btn",)
+_CSS_ACTION_DELETE = _CSS_ACTION + ("delete-btn",)
 
-    __gsignals__ = {
-        "clip-delete": (GObject.SignalFlags.RUN_FIRST, None, (int,)),
-        "clip-pin": (GObject.SignalFlags.RUN_FIRST, None, (int,)),
-        "clip-favorite": (GObject.SignalFlags.RUN_FIRST, None, (int,)),
-        "clip-preview": (GObject.SignalFlags.RUN_FIRST, None, (int,)),
-        "clip-edit": (GObject.SignalFlags.RUN_FIRST, None, (int, str)),
-        "clip-snippet": (GObject.SignalFlags.RUN_FIRST, None, (int,)),
-    }
+# Type-specific quick actions: category -> (icon, tooltip key, handler name)
+QUICK_ACTIONS = {
+    "url": ("web-browser-symbolic", "item.quick.open_url", "_on_open_url"),
+    "email": ("mail-send-symbolic", "item.quick.send_email", "_on_open_email"),
+    "phone": ("call-start-symbolic", "item.quick.dial", "_on_dial_phone"),
+}
+
+
+def _toggle_css_class(widget, name, enabled) -> bool:
+    """Add or remove a CSS class only when its state actually changes.
+
+    Returns True if the class was added or removed.
+    """
+    if enabled == widget.has_css_class(name):
+        return False
+    if enabled:
+        widget.add_css_class(name)
+    else:
+        widget.remove_css_class(name)
+    return True
 
-    def __init__(self, clip_data, settings_manager=None):
+
+class ClipItem(GObject.Object):
+    """List model entry wrapping a single clipboard history row."""
+
+    def __init__(self, clip_data):
         super().__init__()
         self.clip_data = clip_data
-        self.settings = settings_manager
         self.clip_id = clip_data["id"]
         self.content_type = clip_data["content_type"]
         self.category = clip_data.get("category", "text") or "text"
@@ -47,46 +82,78 @@ class ClipItemWidget(Gtk.ListBoxRow):
         self.thumb_path = clip_data.get("thumb_path")
         self.pinned = bool(clip_data["pinned"])
         self.favorite = bool(clip_data.get("favorite", 0))
+        self.is_snippet = bool(clip_data.get("is_snippet", 0))
         self.is_sensitive = bool(clip_data.get("is_sensitive", 0))
         self.masked = self.is_sensitive
         self.created_at = clip_data["created_at"]
         self.used_at = clip_data["used_at"]
         self.use_count = clip_data.get("use_count", 1) or 1
         self.preview_text = clip_data["preview"] or ""
-        self.metadata = {}
-        if clip_data.get("metadata_json"):
-            try:
-                self.metadata = json.loads(clip_data["metadata_json"])
-            except (json.JSONDecodeError, TypeError):
-                pass
-        
-        # We need to keep reference to label to update it
-        self.preview_label = None
-
-        self.set_css_classes(["clip-row"])
-        if self.pinned:
-            self.add_css_class("pinned")
-        if self.favorite:
-            self.add_css_class("favorited")
-        self.add_css_class(f"category-{self.category}")
+        self._metadata = None
+        # Thumbnail texture, loaded the first time the item is bound
+        self.thumb_texture = None
+
+    @property
+    def metadata(self) -> dict:
+        """Parsed metadata_json; decoded on first access only."""
+        if self._metadata is None:
+            self._metadata = {}
+            raw = self.clip_data.get("metadata_json")
+            if raw:
+                try:
+                    self._metadata = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+                except (ValueError, TypeError):
+                    pass
+        return self._metadata
+
+
+class ClipItemWidget(Gtk.Box):
+    """Row widget of the history list.
+
+    Built once per visible list slot by the list factory and re-bound to a
+    different ClipItem as the user scrolls.
+    """
+
+    __gsignals__ = {
+        "clip-delete": (GObject.SignalFlags.RUN_FIRST, None, (int,)),
+        "clip-pin": (GObject.SignalFlags.RUN_FIRST, None, (int,)),
+        "clip-favorite": (GObject.SignalFlags.RUN_FIRST, None, (int,)),
+        "clip-preview": (GObject.SignalFlags.RUN_FIRST, None, (int,)),
+        "clip-edit": (GObject.SignalFlags.RUN_FIRST, None, (int, str)),
+        "clip-snippet": (GObject.SignalFlags.RUN_FIRST, None, (int,)),
+    }
+
+    def __init__(self, action_mask=ACT_ALL):
+        super().__init__(css_classes=["clip-row"], focusable=True)
+        self.item = None
+        self.action_mask = action_mask
+        self._category_class = None
+        self._icon_class = None
+        # Category whose quick action the quick button currently shows
+        self._quick_category = None
 
         self._build_ui()
         self._setup_drag()
 
+    @property
+    def clip_id(self):
+        return self.item.clip_id if self.item else None
+
     def _build_ui(self):
         # Main horizontal box
         main_box = Gtk.Box(
             orientation=Gtk.Orientation.HORIZONTAL,
             spacing=12,
+            hexpand=True,
             margin_top=8,
             margin_bottom=8,
             margin_start=12,
             margin_end=8,
         )
-        self.set_child(main_box)
+        self.append(main_box)
 
-        # Left: Type indicator
-        main_box.append(self._create_left_indicator())
+        # Left: Type indicator (thumbnail, color swatch or category icon)
+        self._build_left_indicator(main_box)
 
         # Center: Content
         center_box = Gtk.Box(
@@ -97,91 +164,24 @@ class ClipItemWidget(Gtk.ListBoxRow):
         )
         main_box.append(center_box)
 
-        # Preview text
-        if self.category == "code" and self.text_content:
-            # Keep list preview plain-text to avoid GTK markup rendering edge-cases.
-            text_to_show = tr("item.masked") if self.masked else self.preview_text
-            self.preview_label = Gtk.Label(
-                use_markup=False,
-                label=text_to_show,
-                xalign=0,
-                lines=2,
-                ellipsize=3,
-                max_width_chars=44,
-                css_classes=["clip-preview", "monospace"],
-            )
-        elif self.category == "color":
-            color_val = self.metadata.get("color_value", self.preview_text)
-            self.preview_label = Gtk.Label(
-                label=color_val,
-                xalign=0,
-                css_classes=["clip-preview", "monospace"],
-            )
-        else:
-            text_to_show = tr("item.masked") if self.masked else self.preview_text
-            self.preview_label = Gtk.Label(
-                label=text_to_show,
-                xalign=0,
-                wrap=True,
-                wrap_mode=2,
-                max_width_chars=44,
-                lines=2,
-                ellipsize=3,
-                css_classes=["clip-preview"],
-            )
-            if self.masked:
-                self.preview_label.add_css_class("dim-label")
-
+        # Preview text; plain text only to avoid GTK markup rendering edge-cases
+        self.preview_label = Gtk.Label(
+            use_markup=False,
+            xalign=0,
+            wrap_mode=2,
+            max_width_chars=44,
+            css_classes=["clip-preview"],
+        )
         center_box.append(self.preview_label)
 
-        # Bottom row: metadata
-        bottom_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        center_box.append(bottom_row)
-
-        # Time
-        time_label = Gtk.Label(
-            label=format_time_ago(self.used_at),
+        # Bottom line: time, then page title and domain (URLs), language (code)
+        # and use count, all in one label
+        self.meta_label = Gtk.Label(
             xalign=0,
-            css_classes=["clip-time", "dim-label"],
+            ellipsize=3,
+            css_classes=["clip-meta", "dim-label"],
         )
-        bottom_row.append(time_label)
-
-        # Page title for URLs
-        if self.metadata.get("page_title"):
-            title_label = Gtk.Label(
-                label=f"· {self.metadata['page_title'][:35]}",
-                xalign=0,
-                ellipsize=3,
-                css_classes=["clip-meta", "dim-label"],
-            )
-            bottom_row.append(title_label)
-
-        # Domain for URLs
-        if self.metadata.get("domain"):
-            domain_label = Gtk.Label(
-                label=f"· {self.metadata['domain']}",
-                xalign=0,
-                css_classes=["clip-meta", "dim-label"],
-            )
-            bottom_row.append(domain_label)
-
-        # Language for code
-        if self.metadata.get("language"):
-            lang_label = Gtk.Label(
-                label=f"· {self.metadata['language']}",
-                xalign=0,
-                css_classes=["clip-meta", "dim-label", "monospace"],
-            )
-            bottom_row.append(lang_label)
-
-        # Use count if > 1
-        if self.use_count and self.use_count > 1:
-            count_label = Gtk.Label(
-                label=f"· ×{self.use_count}",
-                xalign=0,
-                css_classes=["clip-meta", "dim-label"],
-            )
-            bottom_row.append(count_label)
+        center_box.append(self.meta_label)
 
         # Right: Action buttons
         actions_box = Gtk.Box(
@@ -192,242 +192,103 @@ class ClipItemWidget(Gtk.ListBoxRow):
         )
         main_box.append(actions_box)
 
-        # Top actions row
         top_actions = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=2)
         actions_box.append(top_actions)
-
-        # Collect all action buttons for navigation
-        self.action_buttons = []
-        
-        # Get settings manager from root (passed in __init__)
-        def should_show(key):
-            if not self.settings:
-                return True
-            return self.settings.get(f"show_action_{key}") == "true"
-
-        # Quick action (type-specific)
-        if should_show("quick"):
-            quick_action = self._get_quick_action()
-            if quick_action:
-                icon, tooltip, callback = quick_action
-                qa_btn = Gtk.Button(
-                    icon_name=icon,
-                    css_classes=["flat", "circular", "clip-action-btn", "quick-action-btn"],
-                    tooltip_text=tooltip,
-                    valign=Gtk.Align.CENTER,
-                    focusable=True,
-                )
-                qa_btn.connect("clicked", callback)
-                top_actions.append(qa_btn)
-                self.action_buttons.append(qa_btn)
-
-        # Smart Actions: Edit (for text)
-        if self.text_content and should_show("edit"):
-            edit_btn = Gtk.Button(
-                icon_name="document-edit-symbolic",
-                css_classes=["flat", "circular", "clip-action-btn"],
-                tooltip_text=tr("item.tooltip.edit"),
-                valign=Gtk.Align.CENTER,
-                focusable=True,
-            )
-            edit_btn.connect("clicked", self._on_edit_clicked)
-            top_actions.append(edit_btn)
-            self.action_buttons.append(edit_btn)
-
-        # Smart Actions: Translate and QR (for text)
-        if self.text_content:
-            # Translate
-            if should_show("translate"):
-                trans_btn = Gtk.Button(
-                    icon_name="preferences-desktop-locale-symbolic",
-                    css_classes=["flat", "circular", "clip-action-btn"],
-                    tooltip_text=tr("item.tooltip.translate"),
-                    valign=Gtk.Align.CENTER,
-                    focusable=True,
-                )
-                trans_btn.connect("clicked", self._on_translate_clicked)
-                top_actions.append(trans_btn)
-                self.action_buttons.append(trans_btn)
-
-            # QR Code
-            if should_show("qr"):
-                from . import actions
-                if actions.HAS_QR:
-                    qr_btn = Gtk.Button(
-                        icon_name="camera-video-symbolic", 
-                        css_classes=["flat", "circular", "clip-action-btn"],
-                        tooltip_text=tr("item.tooltip.qr"),
-                        valign=Gtk.Align.CENTER,
-                        focusable=True,
-                    )
-                    qr_btn.connect("clicked", self._on_qr_clicked)
-                    top_actions.append(qr_btn)
-                    self.action_buttons.append(qr_btn)
-
-        # Reveal/Hide Button (for sensitive)
-        if self.is_sensitive:
-            icon = "view-reveal-symbolic" if self.masked else "view-conceal-symbolic"
-            reveal_btn = Gtk.Button(
-                icon_name=icon,
-                css_classes=["flat", "circular", "clip-action-btn"],
-                tooltip_text=tr("item.tooltip.reveal"),
-                valign=Gtk.Align.CENTER,
-                focusable=True,
-            )
-            reveal_btn.connect("clicked", self._on_reveal_clicked)
-            top_actions.append(reveal_btn)
-            self.action_buttons.append(reveal_btn)
-
-        # Preview button
-        if should_show("preview"):
-            preview_btn = Gtk.Button(
-                icon_name="view-more-symbolic",
-                css_classes=["flat", "circular", "clip-action-btn"],
-                tooltip_text=tr("item.tooltip.preview"),
-                valign=Gtk.Align.CENTER,
-                focusable=True,
-            )
-            preview_btn.connect("clicked", self._on_preview_clicked)
-            top_actions.append(preview_btn)
-            self.action_buttons.append(preview_btn)
-
-        # Bottom actions row
         bottom_actions = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=2)
         actions_box.append(bottom_actions)
 
-        # Favorite button
-        if should_show("favorite"):
-            fav_icon = "starred-symbolic" if self.favorite else "non-starred-symbolic"
-            self.fav_btn = Gtk.Button(
-                icon_name=fav_icon,
-                css_classes=["flat", "circular", "clip-action-btn"],
-                tooltip_text=tr("item.tooltip.favorite"),
-                valign=Gtk.Align.CENTER,
-                focusable=True,
-            )
-            if self.favorite:
-                self.fav_btn.add_css_class("favorite-btn")
-            self.fav_btn.connect("clicked", self._on_favorite_clicked)
-            bottom_actions.append(self.fav_btn)
-            self.action_buttons.append(self.fav_btn)
-
-        # Pin button
-        if should_show("pin"):
-            pin_icon = "view-pin-symbolic" if self.pinned else "view-pin-symbolic"
-            self.pin_btn = Gtk.Button(
-                icon_name=pin_icon,
-                css_classes=["flat", "circular", "clip-action-btn"],
-                tooltip_text=tr("item.tooltip.pin") if not self.pinned else tr("item.tooltip.unpin"),
-                valign=Gtk.Align.CENTER,
-                focusable=True,
-            )
-            if self.pinned:
-                self.pin_btn.add_css_class("pinned-btn")
-            self.pin_btn.connect("clicked", self._on_pin_clicked)
-            bottom_actions.append(self.pin_btn)
-            self.action_buttons.append(self.pin_btn)
-
-        # Snippet button
-        if should_show("snippet"):
-            self.is_snippet = bool(self.clip_data.get("is_snippet", 0))
-            snip_icon = "user-bookmarks-symbolic"
-            self.snip_btn = Gtk.Button(
-                icon_name=snip_icon,
-                css_classes=["flat", "circular", "clip-action-btn"],
-                tooltip_text=tr("item.tooltip.to_snippets") if not self.is_snippet else tr("item.tooltip.remove_snippets"),
-                valign=Gtk.Align.CENTER,
-                focusable=True,
-            )
-            if self.is_snippet:
-                self.snip_btn.add_css_class("pinned-btn") 
-                
-            self.snip_btn.connect("clicked", self._on_snippet_clicked)
-            bottom_actions.append(self.snip_btn)
-            self.action_buttons.append(self.snip_btn)
-
-        if should_show("delete"):
-            delete_btn = Gtk.Button(
-                icon_name="edit-delete-symbolic",
-                css_classes=["flat", "circular", "clip-action-btn", "delete-btn"],
-                tooltip_text=tr("item.tooltip.delete"),
-                valign=Gtk.Align.CENTER,
-                focusable=True,
-            )
-            delete_btn.connect("clicked", self._on_delete_clicked)
-            bottom_actions.append(delete_btn)
-            self.action_buttons.append(delete_btn)
+        # Buttons of actions disabled in settings are never created; bind()
+        # only shows or hides the ones that depend on the item
+        mask = self.action_mask
+        if not actions.HAS_QR:
+            mask &= ~ACT_QR
+        self.action_buttons = []
+        self.qa_btn = self._add_action_button(
+            mask & ACT_QUICK, top_actions, None, None, self._on_quick_clicked, _CSS_ACTION_QUICK
+        )
+        self.edit_btn = self._add_action_button(
+            mask & ACT_EDIT, top_actions, "document-edit-symbolic", tr("item.tooltip.edit"),
+            self._on_edit_clicked,
+        )
+        self.trans_btn = self._add_action_button(
+            mask & ACT_TRANSLATE, top_actions, "preferences-desktop-locale-symbolic",
+            tr("item.tooltip.translate"), self._on_translate_clicked,
+        )
+        self.qr_btn = self._add_action_button(
+            mask & ACT_QR, top_actions, "camera-video-symbolic", tr("item.tooltip.qr"),
+            self._on_qr_clicked,
+        )
+        # Sensitive clips can always be revealed
+        self.reveal_btn = self._add_action_button(
+            True, top_actions, "view-reveal-symbolic", tr("item.tooltip.reveal"),
+            self._on_reveal_clicked,
+        )
+        self.preview_btn = self._add_action_button(
+            mask & ACT_PREVIEW, top_actions, "view-more-symbolic", tr("item.tooltip.preview"),
+            self._on_preview_clicked,
+        )
+        self.fav_btn = self._add_action_button(
+            mask & ACT_FAVORITE, bottom_actions, "non-starred-symbolic", tr("item.tooltip.favorite"),
+            self._on_favorite_clicked,
+        )
+        self.pin_btn = self._add_action_button(
+            mask & ACT_PIN, bottom_actions, "view-pin-symbolic", tr("item.tooltip.pin"),
+            self._on_pin_clicked,
+        )
+        self.snip_btn = self._add_action_button(
+            mask & ACT_SNIPPET, bottom_actions, "user-bookmarks-symbolic",
+            tr("item.tooltip.to_snippets"), self._on_snippet_clicked,
+        )
+        self.delete_btn = self._add_action_button(
+            mask & ACT_DELETE, bottom_actions, "edit-delete-symbolic", tr("item.tooltip.delete"),
+            self._on_delete_clicked, _CSS_ACTION_DELETE,
+        )
 
         # Keyboard controller for navigating actions
         self._key_controller = Gtk.EventControllerKey()
         self._key_controller.connect("key-pressed", self._on_key_pressed)
         self.add_controller(self._key_controller)
 
-    def _on_key_pressed(self, controller, keyval, keycode, state):
-        """Handle Left/Right arrows to navigate actions."""
-        if keyval == Gdk.KEY_Right:
-            # If row is focused, move to first button
-            if self.is_focus():
-                if self.action_buttons:
-                    self.action_buttons[0].grab_focus()
-                    return True
-            # If a button is focused, move to next
-            for i, btn in enumerate(self.action_buttons):
-                if btn.is_focus():
-                    if i + 1 < len(self.action_buttons):
-                        self.action_buttons[i+1].grab_focus()
-                    return True
-        elif keyval == Gdk.KEY_Left:
-            # If a button is focused, move left or back to row
-            for i, btn in enumerate(self.action_buttons):
-                if btn.is_focus():
-                    if i > 0:
-                        self.action_buttons[i-1].grab_focus()
-                    else:
-                        self.grab_focus()
-                    return True
-        return False
-
-    def _create_left_indicator(self) -> Gtk.Widget:
-        """Create left-side icon or thumbnail."""
-        if self.content_type == "image" and self.thumb_path:
-            pixbuf = load_pixbuf_from_path(self.thumb_path, size=48)
-            if pixbuf:
-                texture = Gdk.Texture.new_for_pixbuf(pixbuf)
-                frame = Gtk.Frame(css_classes=["clip-image-frame"])
-                picture = Gtk.Picture(
-                    paintable=texture,
-                    content_fit=Gtk.ContentFit.COVER,
-                    width_request=48,
-                    height_request=48,
-                    css_classes=["clip-thumbnail"],
-                )
-                frame.set_child(picture)
-                return frame
-
-        if self.category == "color":
-            color_val = self.metadata.get("color_value", "#888")
-            color_box = Gtk.Frame(css_classes=["clip-color-frame"])
-            # Use a drawing area for the color swatch
-            swatch = Gtk.Box(
-                width_request=48,
-                height_request=48,
-                css_classes=["color-swatch"],
-            )
-            # Apply inline color via CSS — we can't set bg directly in GTK4
-            # So use a label with the color emoji
-            color_label = Gtk.Label(
-                label="██",
-                css_classes=["color-swatch-label"],
-            )
-            swatch.append(color_label)
-            color_box.set_child(swatch)
-            return color_box
-
-        # Default icon
-        icon_name = ContentDetector.get_category_icon(self.category)
-        frame = Gtk.Frame(css_classes=["clip-icon-frame", f"icon-{self.category}"])
-        icon = Gtk.Image(
+    def _add_action_button(self, enabled, box, icon_name, tooltip, callback, css_classes=_CSS_ACTION):
+        if not enabled:
+            return None
+        btn = Gtk.Button(
             icon_name=icon_name,
+            css_classes=css_classes,
+            tooltip_text=tooltip,
+            valign=Gtk.Align.CENTER,
+            focusable=True,
+        )
+        btn.connect("clicked", callback)
+        box.append(btn)
+        self.action_buttons.append(btn)
+        return btn
+
+    def _build_left_indicator(self, box):
+        """Create the three left-side indicators; bind() shows one of them."""
+        self.thumb_picture = Gtk.Picture(
+            content_fit=Gtk.ContentFit.COVER,
+            width_request=48,
+            height_request=48,
+            css_classes=["clip-thumbnail"],
+        )
+        self.thumb_frame = Gtk.Frame(css_classes=["clip-image-frame"], visible=False)
+        self.thumb_frame.set_child(self.thumb_picture)
+        box.append(self.thumb_frame)
+
+        # Apply inline color via CSS — we can't set bg directly in GTK4
+        # So use a label with the color emoji
+        swatch = Gtk.Box(
+            width_request=48,
+            height_request=48,
+            css_classes=["color-swatch"],
+        )
+        swatch.append(Gtk.Label(label="██", css_classes=["color-swatch-label"]))
+        self.color_frame = Gtk.Frame(css_classes=["clip-color-frame"], visible=False)
+        self.color_frame.set_child(swatch)
+        box.append(self.color_frame)
+
+        self.type_icon = Gtk.Image(
             pixel_size=22,
             css_classes=["clip-type-icon"],
             margin_top=8,
@@ -435,142 +296,253 @@ class ClipItemWidget(Gtk.ListBoxRow):
             margin_start=8,
             margin_end=8,
         )
-        frame.set_child(icon)
-        return frame
-
-    def _get_quick_action(self):
-        """Get type-specific quick action (icon, tooltip, callback)."""
-        if self.category == "url":
-            return ("web-browser-symbolic", tr("item.quick.open_url"), self._on_open_url)
-        elif self.category == "email":
-            return ("mail-send-symbolic", tr("item.quick.send_email"), self._on_open_email)
-        elif self.category == "phone":
-            return ("call-start-symbolic", tr("item.quick.dial"), self._on_dial_phone)
-        return None
+        self.icon_frame = Gtk.Frame(css_classes=["clip-icon-frame"])
+        self.icon_frame.set_child(self.type_icon)
+        box.append(self.icon_frame)
+
+    # --- Binding ---
+
+    def bind(self, item: ClipItem):
+        """Show item in this row, updating the existing widgets in place."""
+        self.item = item
+
+        category_class = f"category-{item.category}"
+        if category_class != self._category_class:
+            if self._category_class:
+                self.remove_css_class(self._category_class)
+            self.add_css_class(category_class)
+            self._category_class = category_class
+
+        self._bind_left_indicator(item)
+        self._bind_preview(item)
+
+        parts = [format_time_ago(item.used_at)]
+        # Only URL and code rows show metadata; other rows never parse it
+        if item.category in ("url", "code"):
+            metadata = item.metadata
+            if metadata.get("page_title"):
+                parts.append(metadata["page_title"][:35])
+            if metadata.get("domain"):
+                parts.append(metadata["domain"])
+            if metadata.get("language"):
+                parts.append(metadata["language"])
+        if item.use_count > 1:
+            parts.append(f"×{item.use_count}")
+        self.meta_label.set_label(" · ".join(parts))
+
+        if self.qa_btn:
+            quick_action = QUICK_ACTIONS.get(item.category)
+            self.qa_btn.set_visible(quick_action is not None)
+            if quick_action and item.category != self._quick_category:
+                icon, tooltip_key, _ = quick_action
+                self.qa_btn.set_icon_name(icon)
+                self.qa_btn.set_tooltip_text(tr(tooltip_key))
+                self._quick_category = item.category
+        has_text = bool(item.text_content)
+        for btn in (self.edit_btn, self.trans_btn, self.qr_btn):
+            if btn:
+                btn.set_visible(has_text)
+        self.reveal_btn.set_visible(item.is_sensitive)
+
+        self._apply_pin_state(item.pinned)
+        self._apply_favorite_state(item.favorite)
+        self._apply_snippet_state(item.is_snippet)
+
+    def unbind(self):
+        """Release the bound item so the row can be reused."""
+        self.item = None
+        self.thumb_picture.set_paintable(None)
+
+    def _bind_left_indicator(self, item):
+        texture = None
+        if item.content_type == "image" and item.thumb_path:
+            if item.thumb_texture is None:
+                item.thumb_texture = get_thumbnail_texture(item.thumb_path, size=48)
+            texture = item.thumb_texture
+
+        self.thumb_picture.set_paintable(texture)
+        self.thumb_frame.set_visible(texture is not None)
+        is_color = texture is None and item.category == "color"
+        self.color_frame.set_visible(is_color)
+        self.icon_frame.set_visible(texture is None and not is_color)
+        if texture is None and not is_color:
+            self.type_icon.set_from_icon_name(ContentDetector.get_category_icon(item.category))
+            icon_class = f"icon-{item.category}"
+            if icon_class != self._icon_class:
+                if self._icon_class:
+                    self.icon_frame.remove_css_class(self._icon_class)
+                self.icon_frame.add_css_class(icon_class)
+                self._icon_class = icon_class
+
+    def _bind_preview(self, item):
+        label = self.preview_label
+        if item.category == "color":
+            label.set_label(item.metadata.get("color_value", item.preview_text))
+            label.set_wrap(False)
+            label.set_lines(-1)
+            label.set_ellipsize(Pango.EllipsizeMode.NONE)
+            label.set_max_width_chars(-1)
+            _toggle_css_class(label, "monospace", True)
+            _toggle_css_class(label, "dim-label", False)
+        else:
+            is_code = item.category == "code" and bool(item.text_content)
+            label.set_label(tr("item.masked") if item.masked else item.preview_text)
+            label.set_wrap(not is_code)
+            label.set_lines(2)
+            label.set_ellipsize(Pango.EllipsizeMode.END)
+            label.set_max_width_chars(44)
+            _toggle_css_class(label, "monospace", is_code)
+            _toggle_css_class(label, "dim-label", item.masked)
+        self.reveal_btn.set_icon_name(
+            "view-reveal-symbolic" if item.masked else "view-conceal-symbolic"
+        )
+
+    def _on_key_pressed(self, controller, keyval, keycode, state):
+        """Handle Left/Right arrows to navigate actions."""
+        if keyval not in (Gdk.KEY_Right, Gdk.KEY_Left):
+            return False
+        # Ask the window for the focus widget once instead of each button
+        root = self.get_root()
+        focus = root.get_focus() if root else None
+        buttons = [btn for btn in self.action_buttons if btn.get_visible()]
+        if focus is self:
+            # If row is focused, move to first button
+            if keyval == Gdk.KEY_Right and buttons:
+                buttons[0].grab_focus()
+                return True
+            return False
+        try:
+            i = buttons.index(focus)
+        except ValueError:
+            return False
+        if keyval == Gdk.KEY_Right:
+            if i + 1 < len(buttons):
+                buttons[i+1].grab_focus()
+        elif i > 0:
+            buttons[i-1].grab_focus()
+        else:
+            # Left from the first button goes back to the row
+            self.grab_focus()
+        return True
 
     def _setup_drag(self):
         """Setup drag-and-drop source."""
-        if self.text_content:
-            drag_source = Gtk.DragSource()
-            drag_source.set_actions(Gdk.DragAction.COPY)
-            drag_source.connect("prepare", self._on_drag_prepare)
-            self.add_controller(drag_source)
+        drag_source = Gtk.DragSource()
+        drag_source.set_actions(Gdk.DragAction.COPY)
+        drag_source.connect("prepare", self._on_drag_prepare)
+        self.add_controller(drag_source)
 
     def _on_drag_prepare(self, source, x, y):
         """Prepare drag data."""
-        if self.text_content:
-            value = GObject.Value(GObject.TYPE_STRING, self.text_content)
+        if self.item and self.item.text_content:
+            value = GObject.Value(GObject.TYPE_STRING, self.item.text_content)
             return Gdk.ContentProvider.new_for_value(value)
         return None
 
     # --- Signal Handlers ---
-    
+
+    def _on_quick_clicked(self, btn):
+        quick_action = QUICK_ACTIONS.get(self.item.category) if self.item else None
+        if quick_action:
+            getattr(self, quick_action[2])(btn)
+
     def _on_edit_clicked(self, btn):
         from .edit_dialog import EditDialog
-        # We need a proper parent window. traversing up or finding root
+        # The row may be re-bound while the dialog is open; keep the item
+        item = self.item
         root = self.get_root()
-        dialog = EditDialog(root, self.text_content, self._on_text_saved)
+        dialog = EditDialog(root, item.text_content, lambda text: self._on_text_saved(item, text))
         dialog.present()
-        
-    def _on_text_saved(self, new_text):
-        if new_text and new_text != self.text_content:
-            self.emit("clip-edit", self.clip_id, new_text)
+
+    def _on_text_saved(self, item, new_text):
+        if new_text and new_text != item.text_content:
+            self.emit("clip-edit", item.clip_id, new_text)
 
     def _on_qr_clicked(self, btn):
-        from . import actions
-        actions.show_qr_code(btn, self.text_content)
+        actions.show_qr_code(btn, self.item.text_content)
 
     def _on_translate_clicked(self, btn):
-        from . import actions
-        actions.open_google_translate(self.text_content)
+        actions.open_google_translate(self.item.text_content)
 
     def _on_pin_clicked(self, btn):
-        self.emit("clip-pin", self.clip_id)
+        self.emit("clip-pin", self.item.clip_id)
 
     def _on_delete_clicked(self, btn):
-        self.emit("clip-delete", self.clip_id)
+        self.emit("clip-delete", self.item.clip_id)
 
     def _on_favorite_clicked(self, btn):
-        self.emit("clip-favorite", self.clip_id)
+        self.emit("clip-favorite", self.item.clip_id)
 
     def _on_preview_clicked(self, btn):
-        self.emit("clip-preview", self.clip_id)
+        self.emit("clip-preview", self.item.clip_id)
 
     def _on_snippet_clicked(self, btn):
-        self.emit("clip-snippet", self.clip_id)
-
-    def update_snippet_state(self, is_snippet: bool):
-        self.is_snippet = is_snippet
-        if is_snippet:
-            self.snip_btn.add_css_class("pinned-btn")
-            self.snip_btn.set_tooltip_text(tr("item.tooltip.remove_snippets"))
-        else:
-            self.snip_btn.remove_css_class("pinned-btn")
-            self.snip_btn.set_tooltip_text(tr("item.tooltip.to_snippets"))
+        self.emit("clip-snippet", self.item.clip_id)
 
     def _on_open_url(self, btn):
-        url = self.metadata.get("url") or self.text_content
+        url = self.item.metadata.get("url") or self.item.text_content
         if url:
-            try:
-                subprocess.Popen(["xdg-open", url], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            except Exception:
-                pass
+            self._launch_uri(url)
 
     def _on_open_email(self, btn):
-        email = self.metadata.get("email") or self.text_content
+        email = self.item.metadata.get("email") or self.item.text_content
         if email:
-            try:
-                subprocess.Popen(["xdg-open", f"mailto:{email}"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            except Exception:
-                pass
+            self._launch_uri(f"mailto:{email}")
 
     def _on_dial_phone(self, btn):
-        phone = self.metadata.get("phone") or self.text_content
+        phone = self.item.metadata.get("phone") or self.item.text_content
         if phone:
-            try:
-                subprocess.Popen(["xdg-open", f"tel:{phone}"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            except Exception:
-                pass
+            self._launch_uri(f"tel:{phone}")
+
+    def _launch_uri(self, uri):
+        # Opened through GTK (portal or default handler), not a spawned xdg-open
+        Gtk.UriLauncher.new(uri).launch(self.get_root(), None, self._on_launch_done)
+
+    def _on_launch_done(self, launcher, result):
+        try:
+            launcher.launch_finish(result)
+        except GLib.Error as e:
+            print(f"[ClipKeeper] Failed to open URI: {e.message}")
+
+    def _on_reveal_clicked(self, btn):
+        # Masking is item state so it survives the row being recycled
+        self.item.masked = not self.item.masked
+        self._bind_preview(self.item)
+
+    # --- State Updates ---
+
+    def update_snippet_state(self, is_snippet: bool):
+        self.item.is_snippet = is_snippet
+        self._apply_snippet_state(is_snippet)
 
     def update_pin_state(self, pinned: bool):
-        self.pinned = pinned
-        if pinned:
-            self.add_css_class("pinned")
-            self.pin_btn.add_css_class("pinned-btn")
-            self.pin_btn.set_tooltip_text(tr("item.tooltip.unpin"))
-        else:
-            self.remove_css_class("pinned")
-            self.pin_btn.remove_css_class("pinned-btn")
-            self.pin_btn.set_tooltip_text(tr("item.tooltip.pin"))
+        self.item.pinned = pinned
+        self._apply_pin_state(pinned)
 
     def update_favorite_state(self, fav: bool):
-        self.favorite = fav
-        if fav:
-            self.add_css_class("favorited")
-            self.fav_btn.set_icon_name("starred-symbolic")
-            self.fav_btn.add_css_class("favorite-btn")
-        else:
-            self.remove_css_class("favorited")
-            self.fav_btn.set_icon_name("non-starred-symbolic")
-            self.fav_btn.remove_css_class("favorite-btn")
+        self.item.favorite = fav
+        self._apply_favorite_state(fav)
+
+    def _apply_snippet_state(self, is_snippet):
+        if not self.snip_btn:
+            return
+        # Tooltips follow the CSS class, so rows re-bound in the same state
+        # skip the translation lookup and the tooltip update
+        if _toggle_css_class(self.snip_btn, "pinned-btn", is_snippet):
+            self.snip_btn.set_tooltip_text(
+                tr("item.tooltip.remove_snippets") if is_snippet else tr("item.tooltip.to_snippets")
+            )
 
-    def _on_reveal_clicked(self, btn):
-        self.masked = not self.masked
-        
-        # Update icon
-        icon = "view-reveal-symbolic" if self.masked else "view-conceal-symbolic"
-        btn.set_icon_name(icon)
-        
-        # Update text
-        if self.category == "code":
-             text = tr("item.masked") if self.masked else self.preview_text
-             self.preview_label.set_use_markup(False)
-             self.preview_label.set_label(text)
-        else:
-             text = tr("item.masked") if self.masked else self.preview_text
-             self.preview_label.set_label(text)
-             
-        if self.masked:
-            self.preview_label.add_css_class("dim-label")
-        else:
-            self.preview_label.remove_css_class("dim-label")
+    def _apply_pin_state(self, pinned):
+        _toggle_css_class(self, "pinned", pinned)
+        if not self.pin_btn:
+            return
+        if _toggle_css_class(self.pin_btn, "pinned-btn", pinned):
+            self.pin_btn.set_tooltip_text(tr("item.tooltip.unpin") if pinned else tr("item.tooltip.pin"))
+
+    def _apply_favorite_state(self, fav):
+        _toggle_css_class(self, "favorited", fav)
+        if not self.fav_btn:
+            return
+        if _toggle_css_class(self.fav_btn, "favorite-btn", fav):
+            self.fav_btn.set_icon_name("starred-symbolic" if fav else "non-starred-symbolic")
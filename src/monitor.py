@@ -228,7 +228,7 @@ class ClipboardMonitor(GObject.GObject):
             return False
 
         # Auto-detect content type
-        category, subtype, metadata, is_sensitive = ContentDetector.detect(text)
+        category, subtype, metadata, is_sensitive = ContentDetector.detect_cached(text)
         preview = truncate_text(text, 120)
 
         clip_id = self.db.add_clip(
@@ -273,15 +273,20 @@ class PreviewPopover(Gtk.Window):
         return False
 
     def _on_ocr(self, btn):
-        """Perform OCR and show text."""
+        """Perform OCR in the background and show text."""
         image_path = self.clip_data.get("image_path")
         if not image_path:
             return
         
-        # Show loading?
+        # Keep the UI responsive while Tesseract runs
+        btn.set_sensitive(False)
         from . import actions
-        text = actions.perform_ocr(image_path)
-        
+        actions.perform_ocr_async(
+            image_path, lambda text: self._on_ocr_done(btn, text)
+        )
+
+    def _on_ocr_done(self, btn, text):
+        btn.set_sensitive(True)
         if text:
             # Show in edit dialog
             from .edit_dialog import EditDialog
@@ -291,6 +296,7 @@ class PreviewPopover(Gtk.Window):
             # Show error toast? Or just label
             # For now just print or ignore
             pass
+        return False
 
     def _on_ocr_save(self, text):
         # User saved the text from OCR.
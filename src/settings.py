@@ -47,6 +47,20 @@ DEFAULTS = {
     "show_action_delete": "true",
 }
 
+# Row action buttons that can be hidden, in display order, and their bits
+# in SettingsManager.action_mask
+ACTION_KEYS = ("quick", "edit", "translate", "qr", "preview", "favorite", "pin", "snippet", "delete")
+ACT_QUICK = 1 << 0
+ACT_EDIT = 1 << 1
+ACT_TRANSLATE = 1 << 2
+ACT_QR = 1 << 3
+ACT_PREVIEW = 1 << 4
+ACT_FAVORITE = 1 << 5
+ACT_PIN = 1 << 6
+ACT_SNIPPET = 1 << 7
+ACT_DELETE = 1 << 8
+ACT_ALL = (1 << len(ACTION_KEYS)) - 1
+
 
 class SettingsManager:
     """Manages application settings with database persistence."""
@@ -54,6 +68,7 @@ class SettingsManager:
     def __init__(self, db: Database):
         self.db = db
         self._cache = {}
+        self._action_mask = None
         self._load_defaults()
 
     def _load_defaults(self):
@@ -79,6 +94,19 @@ class SettingsManager:
     def set(self, key: str, value: str):
         self._cache[key] = value
         self.db.set_setting(key, value)
+        if key.startswith("show_action_"):
+            self._action_mask = None
+
+    @property
+    def action_mask(self) -> int:
+        """Bitmask of the ACT_* row actions enabled in settings."""
+        if self._action_mask is None:
+            mask = 0
+            for bit, key in enumerate(ACTION_KEYS):
+                if self.get(f"show_action_{key}") == "true":
+                    mask |= 1 << bit
+            self._action_mask = mask
+        return self._action_mask
 
 
 class SettingsWindow(Adw.PreferencesWindow):
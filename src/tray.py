@@ -13,6 +13,7 @@ import sys
 import threading
 from typing import Optional
 
+from .content_detector import ContentDetector
 from .i18n import tr
 
 
@@ -269,8 +270,9 @@ class TrayIndicator:
             self.app.activate_action("open-settings", None)
         elif action == "clear" and self.app.db:
             self.app.db.clear_unpinned()
+            ContentDetector.clear_cache()
             if self.app.window and self.app.window.is_visible():
-                self.app.window.refresh_list()
+                self.app.window.schedule_refresh()
             if hasattr(self.app, "_update_tray_stats"):
                 self.app._update_tray_stats()
         elif action == "quit":
@@ -3,6 +3,7 @@ ClipKeeper — Utility functions.
 Hashing, time formatting, text truncation, image handling, syntax highlighting.
 """
 
+import functools
 import hashlib
 import io
 import os
@@ -156,6 +157,24 @@ def load_pixbuf_from_path(path: str, size: int = 48) -> Optional[GdkPixbuf.Pixbu
         return None
 
 
+def get_thumbnail_texture(path: str, size: int = 48) -> Optional[Gdk.Texture]:
+    """Return a scaled texture for path, shared by all rows showing that file."""
+    if not path:
+        return None
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    return _thumbnail_texture(path, mtime_ns, size)
+
+
+@functools.lru_cache(maxsize=256)
+def _thumbnail_texture(path: str, mtime_ns: int, size: int) -> Optional[Gdk.Texture]:
+    # mtime_ns is part of the key so a rewritten file is loaded again
+    pixbuf = load_pixbuf_from_path(path, size=size)
+    return Gdk.Texture.new_for_pixbuf(pixbuf) if pixbuf else None
+
+
 def _load_pixbuf_from_bytes(data: bytes) -> Optional[GdkPixbuf.Pixbuf]:
     """Load a GdkPixbuf from raw bytes."""
     try:
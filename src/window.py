@@ -15,11 +15,15 @@ from gi.repository import Adw, Gdk, Gio, GLib, GObject, Gtk
 from .content_detector import ContentDetector
 from .database import Database
 from .i18n import tr
-from .item_widget import ClipItemWidget
+from .item_widget import ClipItem, ClipItemWidget
 from .preview import PreviewPopover
+from .settings import ACT_ALL
 from .utils import load_texture_from_path
 
 
+# Gtk.ListView.scroll_to() and Gtk.ListScrollFlags arrived in GTK 4.12
+HAS_LIST_SCROLL_TO = hasattr(Gtk, "ListScrollFlags")
+
 # Categories for filter pills
 CATEGORIES = ["all", "text", "url", "code", "image", "email", "phone", "color"]
 
@@ -41,6 +45,9 @@ class ClipKeeperWindow(Adw.ApplicationWindow):
         self._favorites_only = False
         self._snippets_only = False
         self._search_timeout_id = None
+        self._refresh_source_id = None
+        # Action mask the current row widgets were built with
+        self._action_mask = None
 
         self._build_ui()
         self._setup_shortcuts()
@@ -138,12 +145,24 @@ class ClipKeeperWindow(Adw.ApplicationWindow):
 
     def _focus_first_row(self):
         """Focus the first row in the list for keyboard navigation."""
-        row = self.listbox.get_row_at_index(0)
-        if row:
-            self.listbox.select_row(row)
-            row.grab_focus()
+        if self.store.get_n_items():
+            self._select_position(0)
         return False
 
+    def _select_position(self, position: int):
+        """Select, scroll to and focus the row at position."""
+        if HAS_LIST_SCROLL_TO:
+            self.listview.scroll_to(
+                position,
+                Gtk.ListScrollFlags.SELECT | Gtk.ListScrollFlags.FOCUS,
+                None,
+            )
+            return
+        # Older GTK: the list's own scroll action, then focus the list
+        self.selection.set_selected(position)
+        self.listview.activate_action("list.scroll-to-item", GLib.Variant.new_uint32(position))
+        self.listview.grab_focus()
+
     def _on_close_request(self, window):
         """Hide instead of closing (daemon mode)."""
         self.set_visible(False)
@@ -250,15 +269,21 @@ class ClipKeeperWindow(Adw.ApplicationWindow):
             hscrollbar_policy=Gtk.PolicyType.NEVER,
             css_classes=["clip-scroll"],
         )
-        self.listbox = Gtk.ListBox(
-            selection_mode=Gtk.SelectionMode.SINGLE,
+        # Rows are recycled: only about a screenful of ClipItemWidgets exists,
+        # re-bound to ClipItems from the store while scrolling
+        self.store = Gio.ListStore(item_type=ClipItem)
+        self.selection = Gtk.SingleSelection(model=self.store, autoselect=False)
+        self.listview = Gtk.ListView(
+            model=self.selection,
             css_classes=["clip-list"],
-            activate_on_single_click=True,
         )
-        self.listbox.set_placeholder(self._create_placeholder())
-        self.listbox.connect("row-activated", self._on_row_activated)
-        scrolled.set_child(self.listbox)
-        main_box.append(scrolled)
+        self.listview.connect("activate", self._on_item_activated)
+        scrolled.set_child(self.listview)
+
+        self._list_stack = Gtk.Stack(vexpand=True)
+        self._list_stack.add_named(scrolled, "list")
+        self._list_stack.add_named(self._create_placeholder(), "empty")
+        main_box.append(self._list_stack)
 
         # --- Bottom Bar ---
         main_box.append(Gtk.Separator(css_classes=["spacer"]))
@@ -322,31 +347,25 @@ class ClipKeeperWindow(Adw.ApplicationWindow):
 
         # Arrow navigation in the list
         if keyval in (Gdk.KEY_Down, Gdk.KEY_Up):
-            selected = self.listbox.get_selected_row()
-            if selected is None:
-                # No selection — select the first row
-                row = self.listbox.get_row_at_index(0)
-                if row:
-                    self.listbox.select_row(row)
-                    row.grab_focus()
+            count = self.store.get_n_items()
+            if not count:
                 return True
-
-            idx = selected.get_index()
-            if keyval == Gdk.KEY_Down:
-                next_row = self.listbox.get_row_at_index(idx + 1)
+            idx = self.selection.get_selected()
+            if idx == Gtk.INVALID_LIST_POSITION:
+                # No selection — select the first row
+                idx = 0
+            elif keyval == Gdk.KEY_Down:
+                idx = min(idx + 1, count - 1)
             else:
-                next_row = self.listbox.get_row_at_index(max(0, idx - 1))
-
-            if next_row:
-                self.listbox.select_row(next_row)
-                next_row.grab_focus()
+                idx = max(0, idx - 1)
+            self._select_position(idx)
             return True
 
         # Enter to activate selected row (copy & close)
         if keyval in (Gdk.KEY_Return, Gdk.KEY_KP_Enter):
-            selected = self.listbox.get_selected_row()
-            if selected:
-                self._on_row_activated(self.listbox, selected)
+            idx = self.selection.get_selected()
+            if idx != Gtk.INVALID_LIST_POSITION:
+                self._on_item_activated(self.listview, idx)
                 return True
             return False
 
@@ -361,12 +380,23 @@ class ClipKeeperWindow(Adw.ApplicationWindow):
 
     # --- List Management ---
 
+    def schedule_refresh(self):
+        """Refresh the list once the main loop is idle; repeated calls coalesce."""
+        if self._refresh_source_id is None:
+            self._refresh_source_id = GLib.idle_add(
+                self._do_refresh, priority=GLib.PRIORITY_DEFAULT_IDLE
+            )
+
+    def _do_refresh(self) -> bool:
+        self._refresh_source_id = None
+        self.refresh_list()
+        return False
+
     def refresh_list(self):
-        while True:
-            row = self.listbox.get_row_at_index(0)
-            if row is None:
-                break
-            self.listbox.remove(row)
+        # A direct refresh makes a pending scheduled one redundant
+        if self._refresh_source_id is not None:
+            GLib.source_remove(self._refresh_source_id)
+            self._refresh_source_id = None
 
         category = self._active_category if self._active_category != "all" else None
         clips = self.db.get_clips(
@@ -375,23 +405,57 @@ class ClipKeeperWindow(Adw.ApplicationWindow):
             favorites_only=self._favorites_only,
             snippets_only=self._snippets_only,
             limit=100,
+            as_dicts=True,
         )
 
-        for clip in clips:
-            # Assuming ClipKeeperWindow has access to settings via application
-            app = self.get_application()
-            settings = getattr(app, "settings_manager", None)
-            widget = ClipItemWidget(dict(clip), settings_manager=settings)
-            widget.connect("clip-delete", self._on_clip_delete)
-            widget.connect("clip-pin", self._on_clip_pin)
-            widget.connect("clip-favorite", self._on_clip_favorite)
-            widget.connect("clip-preview", self._on_clip_preview)
-            widget.connect("clip-edit", self._on_clip_edit)
-            widget.connect("clip-snippet", self._on_clip_snippet)
-            self.listbox.append(widget)
+        # Row widgets decide which buttons exist once, in the factory's setup;
+        # a new factory is only needed when that choice changed in settings
+        settings = getattr(self.get_application(), "settings_manager", None)
+        action_mask = settings.action_mask if settings else ACT_ALL
+        if action_mask != self._action_mask:
+            self._action_mask = action_mask
+            self.listview.set_factory(self._create_factory())
+
+        self.store.splice(0, self.store.get_n_items(), [ClipItem(clip) for clip in clips])
+        self._list_stack.set_visible_child_name("list" if clips else "empty")
 
         self._update_stats()
 
+    def _create_factory(self) -> Gtk.ListItemFactory:
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self._on_factory_setup)
+        factory.connect("bind", self._on_factory_bind)
+        factory.connect("unbind", self._on_factory_unbind)
+        return factory
+
+    def _on_factory_setup(self, factory, list_item):
+        widget = ClipItemWidget(self._action_mask)
+        widget.connect("clip-delete", self._on_clip_delete)
+        widget.connect("clip-pin", self._on_clip_pin)
+        widget.connect("clip-favorite", self._on_clip_favorite)
+        widget.connect("clip-preview", self._on_clip_preview)
+        widget.connect("clip-edit", self._on_clip_edit)
+        widget.connect("clip-snippet", self._on_clip_snippet)
+        # A single click copies the clip, as with the old list box. The list
+        # view's single-click-activate would also select rows on hover.
+        # Action buttons claim their own clicks, and dragging cancels this.
+        click = Gtk.GestureClick()
+        click.connect("released", self._on_row_clicked, list_item)
+        widget.add_controller(click)
+        # Focus goes to the row widget itself so it can move into its buttons
+        list_item.set_focusable(False)
+        list_item.set_child(widget)
+
+    def _on_row_clicked(self, gesture, n_press, x, y, list_item):
+        if n_press == 1 and list_item.get_item() is not None:
+            self._on_item_activated(self.listview, list_item.get_position())
+
+    def _on_factory_bind(self, factory, list_item):
+        list_item.get_child().bind(list_item.get_item())
+
+    def _on_factory_unbind(self, factory, list_item):
+        list_item.get_child().unbind()
+
     def _update_stats(self):
         stats = self.db.get_stats()
         parts = [f"{stats['total']}"]
@@ -412,7 +476,7 @@ class ClipKeeperWindow(Adw.ApplicationWindow):
                     btn.handler_block_by_func(self._on_category_toggled)
                     btn.set_active(False)
                     btn.handler_unblock_by_func(self._on_category_toggled)
-            self.refresh_list()
+            self.schedule_refresh()
         else:
             # Don't allow deactivating the last active — reset to "all"
             if self._active_category == category:
@@ -428,14 +492,14 @@ class ClipKeeperWindow(Adw.ApplicationWindow):
             # Let's keep them independent for now.
             if self._snip_button.get_active():
                  self._snip_button.set_active(False)
-        self.refresh_list()
+        self.schedule_refresh()
 
     def _on_snippets_toggled(self, button):
         self._snippets_only = button.get_active()
         if self._snippets_only:
              if self._fav_button.get_active():
                  self._fav_button.set_active(False)
-        self.refresh_list()
+        self.schedule_refresh()
 
     # --- Search ---
 
@@ -451,17 +515,17 @@ class ClipKeeperWindow(Adw.ApplicationWindow):
         return False
 
     def _on_search_activate(self, entry):
-        row = self.listbox.get_row_at_index(0)
-        if row:
-            self._on_row_activated(self.listbox, row)
+        if self.store.get_n_items():
+            self._on_item_activated(self.listview, 0)
 
     # --- Row Actions ---
 
-    def _on_row_activated(self, listbox, row):
-        if not isinstance(row, ClipItemWidget):
+    def _on_item_activated(self, listview, position):
+        item = self.store.get_item(position)
+        if item is None:
             return
 
-        clip = self.db.get_clip_by_id(row.clip_id)
+        clip = self.db.get_clip_by_id(item.clip_id)
         if clip is None:
             return
 
@@ -481,24 +545,25 @@ class ClipKeeperWindow(Adw.ApplicationWindow):
                 )
                 clipboard.set_content(content)
 
-        self.db.update_used_at(row.clip_id)
+        self.db.update_used_at(item.clip_id)
         self.set_visible(False)
 
     def _on_clip_delete(self, widget, clip_id):
         self.db.delete_clip(clip_id)
-        self.refresh_list()
+        ContentDetector.clear_cache()
+        self.schedule_refresh()
 
     def _on_clip_pin(self, widget, clip_id):
         new_state = self.db.toggle_pin(clip_id)
         if isinstance(widget, ClipItemWidget):
             widget.update_pin_state(new_state)
-        self.refresh_list()
+        self.schedule_refresh()
 
     def _on_clip_favorite(self, widget, clip_id):
         new_state = self.db.toggle_favorite(clip_id)
         if isinstance(widget, ClipItemWidget):
             widget.update_favorite_state(new_state)
-        self.refresh_list()
+        self.schedule_refresh()
 
     def _on_clip_preview(self, widget, clip_id):
         clip = self.db.get_clip_by_id(clip_id)
@@ -508,7 +573,7 @@ class ClipKeeperWindow(Adw.ApplicationWindow):
 
     def _on_clip_edit(self, widget, clip_id, new_text):
         if self.db.update_clip_text(clip_id, new_text):
-            self.refresh_list()
+            self.schedule_refresh()
 
     def _on_clip_snippet(self, widget, clip_id):
         new_state = self.db.toggle_snippet(clip_id)
@@ -516,7 +581,7 @@ class ClipKeeperWindow(Adw.ApplicationWindow):
             widget.update_snippet_state(new_state)
         # If we are in snippets view, we might want to remove it from list
         if self._snippets_only and not new_state:
-            self.refresh_list()
+            self.schedule_refresh()
 
 
     def _on_incognito_toggled(self, btn):